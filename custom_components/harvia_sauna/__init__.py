@@ -9,18 +9,19 @@ import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 
 from .api_factory import create_api_client, get_provider_from_entry_data
 from .const import (
+    CONF_ENDPOINTS_CACHE,
     CONF_HEATER_POWER,
     DEFAULT_HEATER_POWER_W,
     DOMAIN,
     SERVICE_SET_SESSION,
 )
-from .coordinator import HarviaSaunaCoordinator
+from .coordinator import HarviaSaunaCoordinator, update_derived_values
 from .errors import HarviaAuthError, HarviaConnectionError
 
 _LOGGER = logging.getLogger(__name__)
@@ -52,23 +53,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     username = entry.data[CONF_USERNAME]
     password = entry.data[CONF_PASSWORD]
 
-    # Create API client via provider factory
+    # Create API client via provider factory, reusing cached endpoints
     provider = get_provider_from_entry_data(entry.data)
-    api = create_api_client(hass, username, password, provider)
+    cached_endpoints = entry.data.get(CONF_ENDPOINTS_CACHE)
+    api = create_api_client(hass, username, password, provider, cached_endpoints)
 
     # Authenticate
     try:
         await api.async_authenticate()
     except HarviaAuthError as err:
+        # Cached endpoint metadata may be stale, rediscover next time
+        _async_clear_endpoints_cache(hass, entry)
         raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
     except HarviaConnectionError as err:
+        _async_clear_endpoints_cache(hass, entry)
         raise ConfigEntryNotReady(f"Connection error: {err}") from err
 
+    # Persist freshly discovered endpoints to skip discovery on next start
+    if api.endpoints and api.endpoints != cached_endpoints:
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_ENDPOINTS_CACHE: api.endpoints}
+        )
+
     # Create and initialize coordinator
     coordinator = HarviaSaunaCoordinator(hass, api, entry)
 
     # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except (ConfigEntryAuthFailed, ConfigEntryNotReady):
+        # Login may still work with stale GraphQL endpoints, rediscover on retry
+        _async_clear_endpoints_cache(hass, entry)
+        raise
 
     # Apply configured heater power to devices
     _apply_heater_power(coordinator, entry)
@@ -80,8 +96,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Set up platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Set up platforms once devices are known
+    if coordinator.data.devices:
+        coordinator.platforms_loaded = True
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    else:
+        _async_forward_platforms_on_first_device(hass, entry, coordinator)
 
     # Register services (once)
     _async_register_services(hass)
@@ -99,7 +119,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await coordinator.async_shutdown()
 
     # Unload platforms
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = True
+    if coordinator.platforms_loaded:
+        unload_ok = await hass.config_entries.async_unload_platforms(
+            entry, PLATFORMS
+        )
 
     # Clean up stored data
     if unload_ok:
@@ -117,6 +141,41 @@ async def _async_update_listener(
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+@callback
+def _async_forward_platforms_on_first_device(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: HarviaSaunaCoordinator,
+) -> None:
+    """Forward platform setup once the coordinator reports a device."""
+
+    @callback
+    def _async_check_devices() -> None:
+        if coordinator.platforms_loaded or not coordinator.data.devices:
+            return
+        coordinator.platforms_loaded = True
+        _apply_heater_power(coordinator, entry)
+        entry.async_create_task(
+            hass,
+            hass.config_entries.async_late_forward_entry_setups(entry, PLATFORMS),
+        )
+
+    # The listener also keeps fallback polling alive while no entity exists
+    entry.async_on_unload(coordinator.async_add_listener(_async_check_devices))
+
+
+def _async_clear_endpoints_cache(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop cached endpoint metadata from the config entry."""
+    if CONF_ENDPOINTS_CACHE not in entry.data:
+        return
+    data = {
+        key: value
+        for key, value in entry.data.items()
+        if key != CONF_ENDPOINTS_CACHE
+    }
+    hass.config_entries.async_update_entry(entry, data=data)
+
+
 def _apply_heater_power(
     coordinator: HarviaSaunaCoordinator, entry: ConfigEntry
 ) -> None:
@@ -130,6 +189,7 @@ def _apply_heater_power(
     if coordinator.data:
         for device in coordinator.data.devices.values():
             device.heater_power = heater_power_w
+            update_derived_values(device)
 
 
 def _async_register_services(hass: HomeAssistant) -> None:
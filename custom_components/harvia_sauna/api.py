@@ -2,39 +2,132 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+from functools import lru_cache
 import json
 import logging
 import re
+import time
 from urllib.parse import quote
 
 import botocore.exceptions
+import orjson
 from pycognito import Cognito
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api_base import HarviaApiClientBase
-from .const import ENDPOINTS, MYHARVIA_BASE_URL, MYHARVIA_REGION
+from .api_base import HarviaApiClientBase, decode_jwt_payload
+from .const import (
+    ENDPOINTS,
+    MYHARVIA_BASE_URL,
+    MYHARVIA_REGION,
+    TOKEN_REFRESH_LEAD,
+    TOKEN_REFRESH_RETRY,
+    TOKEN_RENEW_MARGIN,
+    WS_REQUIRED_ENDPOINTS,
+)
 from .errors import HarviaAuthError, HarviaConnectionError
 
 _LOGGER = logging.getLogger(__name__)
 
+_APPSYNC_RE = re.compile(r"^https://(.+)\.appsync-api\.(.+)/graphql$")
+
+# GraphQL documents are built once; per-call code only adds "variables".
+_DEVICE_STATE_SELECTION = "desired\n    reported\n    timestamp\n    __typename"
+_LATEST_DATA_SELECTION = (
+    "deviceId\n    timestamp\n    sessionId\n    type\n    data\n    __typename"
+)
+
+_USER_DETAILS_QUERY = {
+    "operationName": "Query",
+    "variables": {},
+    "query": (
+        "query Query {\n"
+        "  getCurrentUserDetails {\n"
+        "    email\n"
+        "    organizationId\n"
+        "    admin\n"
+        "    given_name\n"
+        "    family_name\n"
+        "    superAdmin\n"
+        "    rdUser\n"
+        "    appSettings\n"
+        "    __typename\n"
+        "  }\n"
+        "}\n"
+    ),
+}
+
+_DEVICE_TREE_QUERY = {
+    "operationName": "Query",
+    "variables": {},
+    "query": "query Query {\n  getDeviceTree\n}\n",
+}
+
+_DEVICE_STATE_QUERY = {
+    "operationName": "Query",
+    "query": (
+        "query Query($deviceId: ID!) {\n"
+        "  getDeviceState(deviceId: $deviceId) {\n"
+        f"    {_DEVICE_STATE_SELECTION}\n"
+        "  }\n"
+        "}\n"
+    ),
+}
+
+_LATEST_DATA_QUERY = {
+    "operationName": "Query",
+    "query": (
+        "query Query($deviceId: String!) {\n"
+        "  getLatestData(deviceId: $deviceId) {\n"
+        f"    {_LATEST_DATA_SELECTION}\n"
+        "  }\n"
+        "}\n"
+    ),
+}
+
+_STATE_CHANGE_MUTATION = {
+    "operationName": "Mutation",
+    "query": (
+        "mutation Mutation("
+        "$deviceId: ID!, $state: AWSJSON!, $getFullState: Boolean"
+        ") {\n"
+        "  requestStateChange("
+        "deviceId: $deviceId, state: $state, getFullState: $getFullState"
+        ")\n"
+        "}\n"
+    ),
+}
+
 
 class HarviaApiClient(HarviaApiClientBase):
     """Client for the MyHarvia Cloud API (Cognito + AppSync GraphQL)."""
 
     supports_push_updates = True
 
-    def __init__(self, hass: HomeAssistant, username: str, password: str) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        username: str,
+        password: str,
+        endpoints: dict | None = None,
+    ) -> None:
         """Initialize the API client."""
         self._hass = hass
+        self._session = async_get_clientsession(hass)
         self._username = username
         self._password = password
-        self._endpoints: dict | None = None
+        self._endpoints: dict | None = endpoints
         self._cognito: Cognito | None = None
         self._token_data: dict | None = None
+        self._auth_headers: dict[str, str] = {}
+        self._id_token_exp: float = 0.0
+        self._token_lock = asyncio.Lock()
         self._user_data: dict | None = None
+        self._ws_info_cache: dict[str, dict] = {}
+        self._ws_url_cache: dict[str, tuple[str, str]] = {}
         self._ws_manager = None
 
     async def async_authenticate(self) -> bool:
@@ -55,61 +148,66 @@ class HarviaApiClient(HarviaApiClientBase):
             _LOGGER.error("MyHarvia connection error: %s", err)
             raise HarviaConnectionError(f"Connection error: {err}") from err
 
-        self._token_data = {
-            "access_token": client.access_token,
-            "refresh_token": client.refresh_token,
-            "id_token": client.id_token,
-        }
+        self._set_token_data(client)
 
         _LOGGER.debug("MyHarvia authentication successful")
         return True
 
     async def async_check_and_renew_tokens(self) -> None:
         """Check and renew tokens if needed."""
-        client = await self._async_get_cognito_client()
-        await self.async_authenticate()
-
-        try:
-            await self._hass.async_add_executor_job(
-                lambda: client.check_token(renew=True)
-            )
-        except Exception as err:
-            _LOGGER.debug("Token refresh failed, re-authenticating: %s", err)
-            # Force full re-authentication
-            self._token_data = None
-            self._cognito = None
+        if self._token_data is None:
+            # Fresh login yields fresh tokens, nothing to renew
             await self.async_authenticate()
-            client = self._cognito
-
-        self._token_data = {
-            "access_token": client.access_token,
-            "refresh_token": client.refresh_token,
-            "id_token": client.id_token,
-        }
+        elif not self._id_token_valid():
+            await self._async_renew_tokens()
 
     async def async_get_id_token(self) -> str:
         """Get a valid ID token, renewing if necessary."""
-        await self.async_check_and_renew_tokens()
+        if self._id_token_valid():
+            return self._token_data["id_token"]
+
+        async with self._token_lock:
+            # Another request may have renewed the token while we waited
+            await self.async_check_and_renew_tokens()
         return self._token_data["id_token"]
 
+    async def async_token_refresh_loop(self) -> None:
+        """Renew tokens ahead of expiry so requests never wait on Cognito."""
+        while True:
+            delay = self._id_token_exp - TOKEN_REFRESH_LEAD - time.time()
+            await asyncio.sleep(max(delay, TOKEN_REFRESH_RETRY))
+            try:
+                async with self._token_lock:
+                    if self._token_data is None:
+                        await self.async_authenticate()
+                    else:
+                        await self._async_renew_tokens()
+            except (HarviaAuthError, HarviaConnectionError) as err:
+                # Requests fall back to inline renewal, retry later
+                _LOGGER.debug("Background token refresh failed: %s", err)
+
     async def async_get_endpoints(self) -> dict:
         """Fetch API endpoints from MyHarvia cloud."""
         if self._endpoints is not None:
             return self._endpoints
 
-        self._endpoints = {}
-        session = async_get_clientsession(self._hass)
-
-        for endpoint in ENDPOINTS:
+        async def _fetch(endpoint: str) -> dict:
             url = f"{MYHARVIA_BASE_URL}/{endpoint}/endpoint"
-            try:
-                async with session.get(url) as response:
-                    self._endpoints[endpoint] = await response.json()
-            except Exception as err:
-                _LOGGER.error("Failed to fetch endpoint %s: %s", endpoint, err)
+            async with self._session.get(url) as response:
+                response.raise_for_status()
+                return await response.json()
+
+        results = await asyncio.gather(
+            *(_fetch(endpoint) for endpoint in ENDPOINTS), return_exceptions=True
+        )
+        for endpoint, result in zip(ENDPOINTS, results):
+            if isinstance(result, BaseException):
+                _LOGGER.error("Failed to fetch endpoint %s: %s", endpoint, result)
                 raise HarviaConnectionError(
-                    f"Failed to fetch endpoint {endpoint}: {err}"
-                ) from err
+                    f"Failed to fetch endpoint {endpoint}: {result}"
+                ) from result
+
+        self._endpoints = dict(zip(ENDPOINTS, results))
 
         _LOGGER.debug("MyHarvia endpoints fetched successfully")
         return self._endpoints
@@ -118,14 +216,14 @@ class HarviaApiClient(HarviaApiClientBase):
         self, endpoint: str, query: dict
     ) -> dict:
         """Execute a GraphQL request against the MyHarvia API."""
-        id_token = await self.async_get_id_token()
-        headers = {"authorization": id_token}
-        session = async_get_clientsession(self._hass)
+        await self.async_get_id_token()
         endpoints = await self.async_get_endpoints()
         url = endpoints[endpoint]["endpoint"]
 
         try:
-            async with session.post(url, json=query, headers=headers) as response:
+            async with self._session.post(
+                url, json=query, headers=self._auth_headers
+            ) as response:
                 if response.status in (401, 403):
                     # Force token reset for next attempt
                     self._token_data = None
@@ -165,43 +263,19 @@ class HarviaApiClient(HarviaApiClientBase):
         if self._user_data is not None:
             return self._user_data
 
-        query = {
-            "operationName": "Query",
-            "variables": {},
-            "query": (
-                "query Query {\n"
-                "  getCurrentUserDetails {\n"
-                "    email\n"
-                "    organizationId\n"
-                "    admin\n"
-                "    given_name\n"
-                "    family_name\n"
-                "    superAdmin\n"
-                "    rdUser\n"
-                "    appSettings\n"
-                "    __typename\n"
-                "  }\n"
-                "}\n"
-            ),
-        }
-        data = await self.async_graphql_request("users", query)
+        data = await self.async_graphql_request("users", _USER_DETAILS_QUERY)
         self._user_data = data["data"]["getCurrentUserDetails"]
         return self._user_data
 
     async def async_get_device_tree(self) -> list[dict]:
         """Get all devices from the device tree."""
-        query = {
-            "operationName": "Query",
-            "variables": {},
-            "query": "query Query {\n  getDeviceTree\n}\n",
-        }
-        result = await self.async_graphql_request("device", query)
+        result = await self.async_graphql_request("device", _DEVICE_TREE_QUERY)
 
         if "data" not in result or "getDeviceTree" not in result["data"]:
             _LOGGER.error("Unexpected device tree response structure")
             return []
 
-        tree_data = json.loads(result["data"]["getDeviceTree"])
+        tree_data = orjson.loads(result["data"]["getDeviceTree"])
         if not tree_data:
             _LOGGER.warning("No devices found in device tree")
             return []
@@ -245,85 +319,96 @@ class HarviaApiClient(HarviaApiClientBase):
 
     async def async_get_device_state(self, device_id: str) -> dict:
         """Get current device state (reported)."""
-        query = {
-            "operationName": "Query",
-            "variables": {"deviceId": device_id},
-            "query": (
-                "query Query($deviceId: ID!) {\n"
-                "  getDeviceState(deviceId: $deviceId) {\n"
-                "    desired\n"
-                "    reported\n"
-                "    timestamp\n"
-                "    __typename\n"
-                "  }\n"
-                "}\n"
-            ),
-        }
+        query = {**_DEVICE_STATE_QUERY, "variables": {"deviceId": device_id}}
         data = await self.async_graphql_request("device", query)
-        return json.loads(data["data"]["getDeviceState"]["reported"])
+        return orjson.loads(data["data"]["getDeviceState"]["reported"])
 
     async def async_get_latest_device_data(self, device_id: str) -> dict:
         """Get latest telemetry data for a device."""
-        query = {
-            "operationName": "Query",
-            "variables": {"deviceId": device_id},
-            "query": (
-                "query Query($deviceId: String!) {\n"
-                "  getLatestData(deviceId: $deviceId) {\n"
-                "    deviceId\n"
-                "    timestamp\n"
-                "    sessionId\n"
-                "    type\n"
-                "    data\n"
-                "    __typename\n"
-                "  }\n"
-                "}\n"
-            ),
-        }
+        query = {**_LATEST_DATA_QUERY, "variables": {"deviceId": device_id}}
         data = await self.async_graphql_request("data", query)
         latest = data["data"]["getLatestData"]
-        device_data = json.loads(latest["data"])
+        device_data = orjson.loads(latest["data"])
         device_data["timestamp"] = latest["timestamp"]
         device_data["type"] = latest["type"]
         return device_data
 
+    async def async_get_device_states(
+        self, device_ids: list[str]
+    ) -> dict[str, dict]:
+        """Get reported state for several devices in a single request."""
+        results = await self._async_graphql_batch(
+            "device",
+            "getDeviceState",
+            "ID!",
+            _DEVICE_STATE_SELECTION,
+            device_ids,
+        )
+        return {
+            device_id: orjson.loads(result["reported"])
+            for device_id, result in results.items()
+        }
+
+    async def async_get_devices_latest_data(
+        self, device_ids: list[str]
+    ) -> dict[str, dict]:
+        """Get latest telemetry for several devices in a single request."""
+        results = await self._async_graphql_batch(
+            "data",
+            "getLatestData",
+            "String!",
+            _LATEST_DATA_SELECTION,
+            device_ids,
+        )
+        latest_data: dict[str, dict] = {}
+        for device_id, latest in results.items():
+            device_data = orjson.loads(latest["data"])
+            device_data["timestamp"] = latest["timestamp"]
+            device_data["type"] = latest["type"]
+            latest_data[device_id] = device_data
+        return latest_data
+
     async def async_request_state_change(
         self, device_id: str, payload: dict
     ) -> dict:
         """Send a state change mutation to the device."""
-        payload_string = json.dumps(payload)
         query = {
-            "operationName": "Mutation",
+            **_STATE_CHANGE_MUTATION,
             "variables": {
                 "deviceId": device_id,
-                "state": payload_string,
+                "state": orjson.dumps(payload).decode(),
                 "getFullState": False,
             },
-            "query": (
-                "mutation Mutation("
-                "$deviceId: ID!, $state: AWSJSON!, $getFullState: Boolean"
-                ") {\n"
-                "  requestStateChange("
-                "deviceId: $deviceId, state: $state, getFullState: $getFullState"
-                ")\n"
-                "}\n"
-            ),
         }
         return await self.async_graphql_request("device", query)
 
     async def async_get_websocket_info(self, endpoint: str) -> dict:
         """Get WebSocket connection URL and host for an endpoint."""
+        if (ws_info := self._ws_info_cache.get(endpoint)) is not None:
+            return ws_info
+
         endpoints = await self.async_get_endpoints()
         endpoint_url = endpoints[endpoint]["endpoint"]
-        regex = r"^https://(.+)\.appsync-api\.(.+)/graphql$"
-        wss_url = re.sub(regex, r"wss://\1.appsync-realtime-api.\2/graphql", endpoint_url)
-        host = re.sub(regex, r"\1.appsync-api.\2", endpoint_url)
-        return {"wss_url": wss_url, "host": host}
+        if (match := _APPSYNC_RE.match(endpoint_url)) is None:
+            # Not an AppSync URL, use it unchanged
+            ws_info = {"wss_url": endpoint_url, "host": endpoint_url}
+        else:
+            api_id, domain = match.groups()
+            ws_info = {
+                "wss_url": f"wss://{api_id}.appsync-realtime-api.{domain}/graphql",
+                "host": f"{api_id}.appsync-api.{domain}",
+            }
+        self._ws_info_cache[endpoint] = ws_info
+        return ws_info
 
     async def async_get_websocket_url(self, endpoint: str) -> str:
         """Build the full authenticated WebSocket URL."""
         ws_info = await self.async_get_websocket_info(endpoint)
         id_token = await self.async_get_id_token()
+        # The URL only changes with the token, reuse it across reconnects
+        cached = self._ws_url_cache.get(endpoint)
+        if cached is not None and cached[0] == id_token:
+            return cached[1]
         header_payload = {
             "Authorization": id_token,
             "host": ws_info["host"],
@@ -331,13 +416,17 @@ class HarviaApiClient(HarviaApiClientBase):
         encoded_header = base64.b64encode(
             json.dumps(header_payload).encode()
         ).decode()
-        return (
+        url = (
             f"{ws_info['wss_url']}"
             f"?header={quote(encoded_header)}"
             f"&payload=e30="
         )
+        self._ws_url_cache[endpoint] = (id_token, url)
+        return url
 
-    async def async_start_push_updates(self, on_device_update) -> None:
+    async def async_start_push_updates(
+        self, on_device_update, on_connection_change=None
+    ) -> None:
         """Start realtime push updates via AppSync WebSocket."""
         if self._ws_manager is not None:
             return
@@ -346,6 +435,7 @@ class HarviaApiClient(HarviaApiClientBase):
         self._ws_manager = HarviaWebSocketManager(
             api=self,
             on_device_update=on_device_update,
+            on_connection_change=on_connection_change,
         )
         await self._ws_manager.async_start()
 
@@ -353,15 +443,24 @@ class HarviaApiClient(HarviaApiClientBase):
         """Stop realtime push updates."""
         if self._ws_manager is None:
             return
-        await self._ws_manager.async_stop()
+        # Skip the stop frames when Home Assistant itself is shutting down
+        await self._ws_manager.async_stop(graceful=not self._hass.is_stopping)
         self._ws_manager = None
 
+    @property
+    def endpoints(self) -> dict | None:
+        """Return discovered endpoint metadata."""
+        return self._endpoints
+
     @property
     def push_connected(self) -> bool:
-        """Return True if any WebSocket connection is active."""
+        """Return True if both the data and device feeds are subscribed."""
         if not self._ws_manager:
             return False
-        return any(ws._websocket is not None for ws in self._ws_manager._connections)
+        subscribed = {
+            ws._endpoint for ws in self._ws_manager._connections if ws._subscribed
+        }
+        return WS_REQUIRED_ENDPOINTS <= subscribed
 
     @property
     def push_connections_info(self) -> list[dict]:
@@ -372,6 +471,7 @@ class HarviaApiClient(HarviaApiClientBase):
             {
                 "label": ws._label,
                 "connected": ws._websocket is not None,
+                "subscribed": ws._subscribed,
                 "reconnect_attempts": ws._reconnect_attempts,
             }
             for ws in self._ws_manager._connections
@@ -379,6 +479,89 @@ class HarviaApiClient(HarviaApiClientBase):
 
     # -- Private helpers --
 
+    async def _async_graphql_batch(
+        self,
+        endpoint: str,
+        field: str,
+        variable_type: str,
+        selection: str,
+        device_ids: list[str],
+    ) -> dict[str, dict]:
+        """Query one field for several devices using aliases in one request.
+
+        AppSync does not accept batched request arrays, so the devices are
+        combined into one document (d0: field(deviceId: $d0) ...). Results
+        are keyed by device ID; devices without data are left out unless
+        none returned any.
+        """
+        if not device_ids:
+            return {}
+
+        aliases, document = _build_batch_query(
+            field, variable_type, selection, len(device_ids)
+        )
+        query = {
+            "operationName": "Query",
+            "variables": dict(zip(aliases, device_ids)),
+            "query": document,
+        }
+        data = await self.async_graphql_request(endpoint, query)
+        results = data.get("data") or {}
+        found = {
+            device_id: results[alias]
+            for alias, device_id in zip(aliases, device_ids)
+            if results.get(alias)
+        }
+        if not found:
+            raise HarviaConnectionError(
+                f"{field} returned no data: {data.get('errors')}"
+            )
+        if len(found) < len(device_ids):
+            _LOGGER.debug(
+                "%s returned no data for %s: %s",
+                field,
+                ", ".join(set(device_ids) - found.keys()),
+                data.get("errors"),
+            )
+        return found
+
+    async def _async_renew_tokens(self) -> None:
+        """Renew tokens via the refresh token, re-authenticating on failure."""
+        client = await self._async_get_cognito_client()
+        try:
+            # check_token() only renews once the token has actually expired,
+            # so renew explicitly when we are inside the safety margin.
+            await self._hass.async_add_executor_job(client.renew_access_token)
+        except Exception as err:
+            _LOGGER.debug("Token refresh failed, re-authenticating: %s", err)
+            # Force full re-authentication
+            self._token_data = None
+            self._cognito = None
+            await self.async_authenticate()
+            return
+
+        self._set_token_data(client)
+
+    def _id_token_valid(self) -> bool:
+        """Return True if the cached ID token is outside the renewal margin."""
+        return (
+            self._token_data is not None
+            and time.time() < self._id_token_exp - TOKEN_RENEW_MARGIN
+        )
+
+    def _set_token_data(self, client: Cognito) -> None:
+        """Store tokens from the Cognito client and cache the ID token expiry."""
+        self._token_data = {
+            "access_token": client.access_token,
+            "refresh_token": client.refresh_token,
+            "id_token": client.id_token,
+        }
+        self._auth_headers = {"authorization": client.id_token}
+        # A token without a readable exp claim is treated as already expiring
+        self._id_token_exp = float(
+            decode_jwt_payload(client.id_token).get("exp", 0)
+        )
+
     async def _async_get_cognito_client(self) -> Cognito:
         """Get or create the Cognito client."""
         if self._cognito is not None:
@@ -399,3 +582,17 @@ class HarviaApiClient(HarviaApiClientBase):
         self._cognito.user_pool_region = MYHARVIA_REGION
 
         return self._cognito
+
+
+@lru_cache(maxsize=8)
+def _build_batch_query(
+    field: str, variable_type: str, selection: str, count: int
+) -> tuple[tuple[str, ...], str]:
+    """Return aliases and the aliased query document for count devices."""
+    aliases = tuple(f"d{index}" for index in range(count))
+    variables = ", ".join(f"${alias}: {variable_type}" for alias in aliases)
+    fields = "".join(
+        f"  {alias}: {field}(deviceId: ${alias}) {{\n    {selection}\n  }}\n"
+        for alias in aliases
+    )
+    return aliases, f"query Query({variables}) {{\n{fields}}}\n"
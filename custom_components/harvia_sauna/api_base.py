@@ -3,8 +3,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
+import base64
+import json
+import logging
 from typing import Any, Awaitable, Callable
 
+from .errors import HarviaAuthError, HarviaConnectionError, raise_first_error
+
+_LOGGER = logging.getLogger(__name__)
+
 
 class HarviaApiClientBase(ABC):
     """Abstract interface for Harvia API providers."""
@@ -31,20 +39,76 @@ class HarviaApiClientBase(ABC):
     async def async_get_latest_device_data(self, device_id: str) -> dict:
         """Return normalized latest telemetry."""
 
+    async def async_get_device_states(
+        self, device_ids: list[str]
+    ) -> dict[str, dict]:
+        """Return normalized state for several devices keyed by device ID."""
+        states = await asyncio.gather(
+            *(self.async_get_device_state(device_id) for device_id in device_ids),
+            return_exceptions=True,
+        )
+        return _collect_per_device(device_ids, states)
+
+    async def async_get_devices_latest_data(
+        self, device_ids: list[str]
+    ) -> dict[str, dict]:
+        """Return normalized latest telemetry keyed by device ID."""
+        telemetries = await asyncio.gather(
+            *(self.async_get_latest_device_data(device_id) for device_id in device_ids),
+            return_exceptions=True,
+        )
+        return _collect_per_device(device_ids, telemetries)
+
+    async def async_get_devices_snapshot(
+        self,
+    ) -> dict[str, tuple[dict | None, dict | None]]:
+        """Return (state, latest telemetry) for all devices keyed by device ID.
+
+        Parts that could not be fetched for a device are None. Errors are only
+        raised for auth failures or when nothing could be fetched at all.
+        """
+        devices = await self.async_get_devices()
+        device_ids = [device["device_id"] for device in devices]
+        # State and telemetry live on separate endpoints, fetch both at once
+        results = await asyncio.gather(
+            self.async_get_device_states(device_ids),
+            self.async_get_devices_latest_data(device_ids),
+            return_exceptions=True,
+        )
+        collected = _collect_per_device(["state", "telemetry"], results)
+        states = collected.get("state", {})
+        telemetries = collected.get("telemetry", {})
+        if device_ids and not states and not telemetries:
+            raise HarviaConnectionError("No data received for any device")
+        return {
+            device_id: (states.get(device_id), telemetries.get(device_id))
+            for device_id in device_ids
+        }
+
     @abstractmethod
     async def async_request_state_change(
         self, device_id: str, payload: dict
     ) -> dict:
         """Send a device state change request."""
 
+    async def async_token_refresh_loop(self) -> None:
+        """Keep credentials fresh in the background if provider supports it."""
+
     async def async_start_push_updates(
-        self, on_device_update: Callable[[dict], Awaitable[None]]
+        self,
+        on_device_update: Callable[[dict], Awaitable[None]],
+        on_connection_change: Callable[[], None] | None = None,
     ) -> None:
         """Start realtime updates if provider supports it."""
 
     async def async_stop_push_updates(self) -> None:
         """Stop realtime updates if provider supports it."""
 
+    @property
+    def endpoints(self) -> dict[str, Any] | None:
+        """Return discovered endpoint metadata for caching, if any."""
+        return None
+
     @property
     def push_connected(self) -> bool:
         """Return True if provider push channel is connected."""
@@ -54,3 +118,35 @@ class HarviaApiClientBase(ABC):
     def push_connections_info(self) -> list[dict[str, Any]]:
         """Return push connection info for diagnostics."""
         return []
+
+
+def _collect_per_device(keys: list[str], results: list[Any]) -> dict[str, Any]:
+    """Map gathered results to their keys, dropping failed ones.
+
+    Auth errors are always raised, other errors only if every result failed.
+    """
+    collected: dict[str, Any] = {}
+    for key, result in zip(keys, results):
+        if isinstance(result, HarviaAuthError):
+            raise result
+        if isinstance(result, BaseException):
+            _LOGGER.debug("Fetching %s failed: %s", key, result)
+            continue
+        collected[key] = result
+    if results and not collected:
+        raise_first_error(results)
+    return collected
+
+
+def decode_jwt_payload(token: str) -> dict[str, Any]:
+    """Decode JWT payload without signature verification."""
+    try:
+        parts = token.split(".")
+        if len(parts) < 2:
+            return {}
+        payload = parts[1]
+        padding = "=" * (-len(payload) % 4)
+        decoded = base64.urlsafe_b64decode(payload + padding).decode()
+        return json.loads(decoded)
+    except Exception:
+        return {}
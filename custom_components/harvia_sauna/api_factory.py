@@ -11,15 +11,22 @@ from .const import API_PROVIDER_HARVIAIO, API_PROVIDER_MYHARVIA, CONF_API_PROVID
 
 
 def create_api_client(
-    hass: HomeAssistant, username: str, password: str, provider: str | None
+    hass: HomeAssistant,
+    username: str,
+    password: str,
+    provider: str | None,
+    endpoints: dict | None = None,
 ) -> HarviaApiClientBase:
-    """Create a provider-specific API client."""
+    """Create a provider-specific API client.
+
+    `endpoints` preseeds previously discovered endpoint metadata.
+    """
     if provider == API_PROVIDER_HARVIAIO:
-        return HarviaIoApiClient(hass, username, password)
+        return HarviaIoApiClient(hass, username, password, endpoints)
     if provider in (None, "", API_PROVIDER_MYHARVIA):
-        return HarviaApiClient(hass, username, password)
+        return HarviaApiClient(hass, username, password, endpoints)
     # Unknown provider: keep backward compatibility by falling back.
-    return HarviaApiClient(hass, username, password)
+    return HarviaApiClient(hass, username, password, endpoints)
 
 
 def get_provider_from_entry_data(entry_data: dict) -> str:
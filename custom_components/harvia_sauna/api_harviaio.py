@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 import logging
@@ -12,7 +13,8 @@ from urllib.parse import quote, urlencode
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api_base import HarviaApiClientBase
+from .api_base import HarviaApiClientBase, decode_jwt_payload
+from .const import WS_REQUIRED_ENDPOINTS
 from .errors import HarviaAuthError, HarviaConnectionError
 
 _LOGGER = logging.getLogger(__name__)
@@ -25,14 +27,21 @@ class HarviaIoApiClient(HarviaApiClientBase):
 
     supports_push_updates = True
 
-    def __init__(self, hass: HomeAssistant, username: str, password: str) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        username: str,
+        password: str,
+        endpoints: dict[str, Any] | None = None,
+    ) -> None:
         """Initialize the API client."""
         self._hass = hass
         self._username = username
         self._password = password
-        self._endpoints: dict[str, Any] | None = None
+        self._endpoints: dict[str, Any] | None = endpoints
         self._token_data: dict[str, Any] | None = None
         self._token_expires_at: float = 0.0
+        self._token_lock = asyncio.Lock()
         self._user_data: dict[str, Any] | None = None
         self._ws_manager = None
         self._devices: list[dict[str, Any]] = []  # Store device list for receiver selection
@@ -49,7 +58,7 @@ class HarviaIoApiClient(HarviaApiClientBase):
             return self._user_data
 
         id_token = await self._async_get_valid_id_token()
-        claims = _decode_jwt_payload(id_token)
+        claims = decode_jwt_payload(id_token)
         self._user_data = {
             "email": claims.get("email") or self._username,
             "organizationId": claims.get("custom:organizationId", ""),
@@ -211,7 +220,9 @@ class HarviaIoApiClient(HarviaApiClientBase):
 
         return {"handled": True, "results": results}
 
-    async def async_start_push_updates(self, on_device_update) -> None:
+    async def async_start_push_updates(
+        self, on_device_update, on_connection_change=None
+    ) -> None:
         """Start GraphQL websocket subscriptions for realtime updates."""
         if self._ws_manager is not None:
             return
@@ -220,6 +231,7 @@ class HarviaIoApiClient(HarviaApiClientBase):
         self._ws_manager = HarviaIoWebSocketManager(
             api=self,
             on_device_update=on_device_update,
+            on_connection_change=on_connection_change,
         )
         await self._ws_manager.async_start()
 
@@ -227,15 +239,24 @@ class HarviaIoApiClient(HarviaApiClientBase):
         """Stop realtime subscriptions."""
         if self._ws_manager is None:
             return
-        await self._ws_manager.async_stop()
+        # Skip the stop frames when Home Assistant itself is shutting down
+        await self._ws_manager.async_stop(graceful=not self._hass.is_stopping)
         self._ws_manager = None
 
+    @property
+    def endpoints(self) -> dict[str, Any] | None:
+        """Return discovered endpoint metadata."""
+        return self._endpoints
+
     @property
     def push_connected(self) -> bool:
-        """Return True if any subscription websocket is connected."""
+        """Return True if both the data and device feeds are subscribed."""
         if not self._ws_manager:
             return False
-        return any(ws._websocket is not None for ws in self._ws_manager._connections)
+        subscribed = {
+            ws._endpoint for ws in self._ws_manager._connections if ws._subscribed
+        }
+        return WS_REQUIRED_ENDPOINTS <= subscribed
 
     @property
     def push_connections_info(self) -> list[dict[str, Any]]:
@@ -246,6 +267,7 @@ class HarviaIoApiClient(HarviaApiClientBase):
             {
                 "label": ws._label,
                 "connected": ws._websocket is not None,
+                "subscribed": ws._subscribed,
                 "reconnect_attempts": ws._reconnect_attempts,
             }
             for ws in self._ws_manager._connections
@@ -315,13 +337,17 @@ class HarviaIoApiClient(HarviaApiClientBase):
 
     async def _async_get_valid_id_token(self) -> str:
         """Return valid ID token, refreshing when required."""
-        if (
-            self._token_data is not None
-            and self._token_data.get("idToken")
-            and time.time() < self._token_expires_at
-        ):
+        if self._id_token_valid():
             return self._token_data["idToken"]
 
+        async with self._token_lock:
+            # Another request may have refreshed the token while we waited
+            if self._id_token_valid():
+                return self._token_data["idToken"]
+            return await self._async_renew_id_token()
+
+    async def _async_renew_id_token(self) -> str:
+        """Refresh or re-login and return the new ID token."""
         if self._token_data and self._token_data.get("refreshToken"):
             try:
                 await self._async_refresh_tokens()
@@ -373,6 +399,14 @@ class HarviaIoApiClient(HarviaApiClientBase):
         self._set_token_data(data)
         _LOGGER.debug("Token refresh successful, new token expires in %s seconds", data.get("expiresIn"))
 
+    def _id_token_valid(self) -> bool:
+        """Return True if a cached, unexpired ID token is available."""
+        return (
+            self._token_data is not None
+            and bool(self._token_data.get("idToken"))
+            and time.time() < self._token_expires_at
+        )
+
     def _set_token_data(self, data: dict[str, Any]) -> None:
         """Store token data and expiration."""
         self._token_data = data
@@ -479,20 +513,6 @@ class HarviaIoApiClient(HarviaApiClientBase):
         return data
 
 
-def _decode_jwt_payload(token: str) -> dict[str, Any]:
-    """Decode JWT payload without signature verification."""
-    try:
-        parts = token.split(".")
-        if len(parts) < 2:
-            return {}
-        payload = parts[1]
-        padding = "=" * (-len(payload) % 4)
-        decoded = base64.urlsafe_b64decode(payload + padding).decode()
-        return json.loads(decoded)
-    except Exception:
-        return {}
-
-
 def _normalize_state_payload(device_id: str, payload: dict[str, Any]) -> dict[str, Any]:
     """Normalize state payload to legacy coordinator shape."""
     state = payload.get("state", {}) if isinstance(payload.get("state"), dict) else payload
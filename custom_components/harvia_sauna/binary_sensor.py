@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
-from typing import Callable
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -13,11 +12,11 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import API_PROVIDER_HARVIAIO, API_PROVIDER_MYHARVIA, CONF_API_PROVIDER, DOMAIN
-from .coordinator import HarviaDeviceData, HarviaSaunaCoordinator
+from .coordinator import HarviaSaunaCoordinator
 from .entity import HarviaBaseEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -27,24 +26,24 @@ _LOGGER = logging.getLogger(__name__)
 class HarviaBinarySensorDescription(BinarySensorEntityDescription):
     """Describe a Harvia binary sensor entity."""
 
-    value_fn: Callable[[HarviaDeviceData], bool | None]
+    attr: str  # HarviaDeviceData attribute holding the value
     providers: tuple[str, ...] | None = None  # None = all providers
 
 
-BINARY_SENSOR_DESCRIPTIONS: list[HarviaBinarySensorDescription] = [
+BINARY_SENSOR_DESCRIPTIONS: tuple[HarviaBinarySensorDescription, ...] = (
     HarviaBinarySensorDescription(
         key="door",
         translation_key="door",
         device_class=BinarySensorDeviceClass.DOOR,
         icon="mdi:door",
-        value_fn=lambda d: d.door_open,
+        attr="door_open",
     ),
     HarviaBinarySensorDescription(
         key="heat_on",
         translation_key="heat_on",
         device_class=BinarySensorDeviceClass.HEAT,
         icon="mdi:fire",
-        value_fn=lambda d: d.heat_on,
+        attr="heat_on",
     ),
     HarviaBinarySensorDescription(
         key="steam_on",
@@ -52,7 +51,7 @@ BINARY_SENSOR_DESCRIPTIONS: list[HarviaBinarySensorDescription] = [
         device_class=BinarySensorDeviceClass.RUNNING,
         icon="mdi:weather-fog",
         entity_registry_enabled_default=False,
-        value_fn=lambda d: d.steam_on,
+        attr="steam_on",
     ),
     # New Fenix-specific binary sensors
     HarviaBinarySensorDescription(
@@ -63,7 +62,7 @@ BINARY_SENSOR_DESCRIPTIONS: list[HarviaBinarySensorDescription] = [
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         providers=(API_PROVIDER_HARVIAIO,),
-        value_fn=lambda d: d.safety_relay,
+        attr="safety_relay",
     ),
     HarviaBinarySensorDescription(
         key="screen_lock",
@@ -72,7 +71,7 @@ BINARY_SENSOR_DESCRIPTIONS: list[HarviaBinarySensorDescription] = [
         icon="mdi:lock",
         entity_category=EntityCategory.DIAGNOSTIC,
         providers=(API_PROVIDER_HARVIAIO,),
-        value_fn=lambda d: d.screen_lock,
+        attr="screen_lock",
     ),
     HarviaBinarySensorDescription(
         key="remote_allowed",
@@ -80,9 +79,9 @@ BINARY_SENSOR_DESCRIPTIONS: list[HarviaBinarySensorDescription] = [
         icon="mdi:remote",
         entity_category=EntityCategory.DIAGNOSTIC,
         providers=(API_PROVIDER_HARVIAIO,),
-        value_fn=lambda d: d.remote_allowed,
+        attr="remote_allowed",
     ),
-]
+)
 
 
 async def async_setup_entry(
@@ -94,17 +93,19 @@ async def async_setup_entry(
     coordinator: HarviaSaunaCoordinator = hass.data[DOMAIN][entry.entry_id]
     provider = entry.data.get(CONF_API_PROVIDER, API_PROVIDER_MYHARVIA)
 
-    entities = []
-    for device_id in coordinator.data.devices:
-        for description in BINARY_SENSOR_DESCRIPTIONS:
-            # Skip entities not matching the configured API provider
-            if description.providers is not None and provider not in description.providers:
-                continue
-            entities.append(
-                HarviaBinarySensor(coordinator, device_id, description)
-            )
-
-    async_add_entities(entities)
+    # Skip entities not matching the configured API provider
+    descriptions = [
+        description
+        for description in BINARY_SENSOR_DESCRIPTIONS
+        if description.providers is None or provider in description.providers
+    ]
+    async_add_entities(
+        [
+            HarviaBinarySensor(coordinator, device_id, description)
+            for device_id in coordinator.data.devices
+            for description in descriptions
+        ]
+    )
 
 
 class HarviaBinarySensor(HarviaBaseEntity, BinarySensorEntity):
@@ -121,11 +122,24 @@ class HarviaBinarySensor(HarviaBaseEntity, BinarySensorEntity):
         """Initialize the binary sensor."""
         super().__init__(coordinator, device_id, description.key)
         self.entity_description = description
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the binary sensor is on."""
+        self._attr_is_on = self._get_value()
+        self._last_available: bool | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the value or availability changed."""
+        self._refresh_device_data()
+        is_on = self._get_value()
+        available = self.available
+        if is_on == self._attr_is_on and available == self._last_available:
+            return
+        self._attr_is_on = is_on
+        self._last_available = available
+        self.async_write_ha_state()
+
+    def _get_value(self) -> bool | None:
+        """Return the current value from coordinator data."""
         device = self._get_device_data()
         if device is None:
             return None
-        return self.entity_description.value_fn(device)
+        return getattr(device, self.entity_description.attr, None)
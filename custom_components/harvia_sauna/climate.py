@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from homeassistant.components.climate import (
     ClimateEntity,
@@ -11,12 +12,14 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import HarviaSaunaCoordinator
 from .entity import HarviaBaseEntity
+from .errors import HarviaConnectionError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,11 +32,12 @@ async def async_setup_entry(
     """Set up Harvia climate entities."""
     coordinator: HarviaSaunaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for device_id in coordinator.data.devices:
-        entities.append(HarviaThermostat(coordinator, device_id))
-
-    async_add_entities(entities)
+    async_add_entities(
+        [
+            HarviaThermostat(coordinator, device_id)
+            for device_id in coordinator.data.devices
+        ]
+    )
 
 
 class HarviaThermostat(HarviaBaseEntity, ClimateEntity):
@@ -54,47 +58,57 @@ class HarviaThermostat(HarviaBaseEntity, ClimateEntity):
     ) -> None:
         """Initialize the thermostat."""
         super().__init__(coordinator, device_id, "thermostat")
+        self._update_attrs()
 
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        device = self._get_device_data()
-        return device.current_temp if device else None
-
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the target temperature."""
-        device = self._get_device_data()
-        return device.target_temp if device else None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached attributes from coordinator data."""
+        self._refresh_device_data()
+        self._update_attrs()
+        self.async_write_ha_state()
 
-    @property
-    def hvac_mode(self) -> HVACMode:
-        """Return the current HVAC mode."""
+    def _update_attrs(self) -> None:
+        """Set temperature and mode attributes with a single device lookup."""
         device = self._get_device_data()
-        if device and device.active:
-            return HVACMode.HEAT
-        return HVACMode.OFF
+        if device is None:
+            self._attr_current_temperature = None
+            self._attr_target_temperature = None
+            self._attr_hvac_mode = HVACMode.OFF
+            return
+        self._attr_current_temperature = device.current_temp
+        self._attr_target_temperature = device.target_temp
+        self._attr_hvac_mode = HVACMode.HEAT if device.active else HVACMode.OFF
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Set new target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is not None:
-            await self.coordinator.async_request_state_change(
-                self._device_id, {"targetTemp": int(temperature)}
-            )
-            # Optimistic update
-            device = self._get_device_data()
-            if device:
-                device.target_temp = int(temperature)
-                self.async_write_ha_state()
+            target = int(temperature)
+            self._apply_optimistic({"targetTemp": target}, target_temp=target)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode."""
         active = hvac_mode == HVACMode.HEAT
-        await self.coordinator.async_request_state_change(
-            self._device_id, {"active": int(active)}
+        self._apply_optimistic({"active": int(active)}, active=active)
+
+    def _apply_optimistic(self, payload: dict[str, Any], **changes: Any) -> None:
+        """Send a state change in the background and update state right away."""
+        self.coordinator.config_entry.async_create_task(
+            self.hass, self._async_send_state_change(payload)
         )
-        # Optimistic update
-        device = self._get_device_data()
-        if device:
-            device.active = active
-            self.async_write_ha_state()
+        self._async_apply_optimistic(**changes)
+
+    async def _async_send_state_change(self, payload: dict[str, Any]) -> None:
+        """Send a state change, reverting the optimistic state on failure."""
+        try:
+            await self.coordinator.async_request_state_change(self._device_id, payload)
+        except ConfigEntryAuthFailed:
+            self.coordinator.config_entry.async_start_reauth(self.hass)
+        except HarviaConnectionError as err:
+            _LOGGER.error("Failed to change state of %s: %s", self._device_id, err)
+        except Exception:
+            # Runs as a background task, nothing else would retrieve the error
+            _LOGGER.exception("Unexpected error changing state of %s", self._device_id)
+        else:
+            return
+        # Poll the real state to undo the optimistic update
+        await self.coordinator.async_request_refresh()
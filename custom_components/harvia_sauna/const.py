@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from types import MappingProxyType
+
 DOMAIN = "harvia_sauna"
 MANUFACTURER = "Harvia"
 
 # MyHarvia Cloud
 MYHARVIA_BASE_URL = "https://prod.myharvia-cloud.net"
 MYHARVIA_REGION = "eu-west-1"
+TOKEN_RENEW_MARGIN = 180  # 3 Minuten vor Ablauf des ID-Tokens erneuern
+TOKEN_REFRESH_LEAD = 300  # Hintergrund-Erneuerung 5 Minuten vor Ablauf
+TOKEN_REFRESH_RETRY = 60  # Mindestabstand zwischen Erneuerungsversuchen
 
 # API Endpoints
 ENDPOINTS = ["users", "device", "events", "data"]
@@ -16,6 +22,13 @@ ENDPOINTS = ["users", "device", "events", "data"]
 WS_RECONNECT_INTERVAL = 1800  # 30 Minuten - periodischer Reconnect
 WS_HEARTBEAT_TIMEOUT = 300  # 5 Minuten ohne Heartbeat = Reconnect
 WS_MAX_RECONNECT_DELAY = 60  # Max Backoff bei Reconnect
+WS_COALESCE_SECONDS = 0.1  # Push-Bursts zu einem Entity-Update zusammenfassen
+WS_PARSE_EXECUTOR_THRESHOLD = 64 * 1024  # Größere Payloads im Executor parsen
+WS_MAX_FRAME_SIZE = 256 * 1024  # Obergrenze pro Frame, begrenzt Speicher je Verbindung
+WS_OPEN_TIMEOUT = 10  # Hängender TLS-Handshake blockiert nicht den Reconnect
+WS_CLOSE_TIMEOUT = 3  # Sekunden für den Closing-Handshake
+WS_STOP_TIMEOUT = 1  # Max. Wartezeit für das Stop-Frame beim Beenden
+WS_REQUIRED_ENDPOINTS = frozenset({"data", "device"})  # Push gilt erst als aktiv, wenn beide Feeds abonniert sind
 
 # Coordinator
 SCAN_INTERVAL_FALLBACK = 300  # 5 Minuten Fallback-Polling falls WebSocket ausfällt
@@ -28,6 +41,7 @@ CONF_HEATER_MODEL = "heater_model"
 CONF_HEATER_POWER = "heater_power"
 
 CONF_API_PROVIDER = "api_provider"
+CONF_ENDPOINTS_CACHE = "endpoints_cache"
 
 # HA Events
 EVENT_SESSION_START = f"{DOMAIN}_session_start"
@@ -46,7 +60,7 @@ API_PROVIDERS: dict[str, str] = {
 }
 
 # Heater models compatible with MyHarvia / Xenio WiFi
-HEATER_MODELS: dict[str, str] = {
+HEATER_MODELS: Mapping[str, str] = MappingProxyType({
     "kip": "Harvia KIP",
     "cilindro": "Harvia Cilindro",
     "spirit": "Harvia Spirit",
@@ -59,24 +73,32 @@ HEATER_MODELS: dict[str, str] = {
     "forte": "Harvia Forte",
     "pro": "Harvia Pro",
     "other": "Other / Unknown",
-}
-
-# Available heater power ratings (kW)
-HEATER_POWER_OPTIONS: dict[str, str] = {
-    "3.0": "3.0 kW",
-    "4.5": "4.5 kW",
-    "6.0": "6.0 kW",
-    "6.8": "6.8 kW",
-    "8.0": "8.0 kW",
-    "9.0": "9.0 kW",
-    "10.5": "10.5 kW",
-    "10.8": "10.8 kW",
-    "12.0": "12.0 kW",
-    "15.0": "15.0 kW",
-    "16.5": "16.5 kW",
-    "17.0": "17.0 kW",
-    "20.0": "20.0 kW",
-}
+})
+
+# Available heater power ratings (kW), ordered numerically for the UI
+HEATER_POWER_OPTIONS: Mapping[str, str] = MappingProxyType(
+    {
+        power: f"{power} kW"
+        for power in sorted(
+            (
+                "3.0",
+                "4.5",
+                "6.0",
+                "6.8",
+                "8.0",
+                "9.0",
+                "10.5",
+                "10.8",
+                "12.0",
+                "15.0",
+                "16.5",
+                "17.0",
+                "20.0",
+            ),
+            key=float,
+        )
+    }
+)
 
 # Heater
 DEFAULT_HEATER_POWER_W = 10800  # Default Nennleistung in Watt (10.8 kW)
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import sys
 import time
 from collections import deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from datetime import timedelta
-from typing import Any
+from typing import Any, Callable
+
+import orjson
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
@@ -22,6 +25,8 @@ from .const import (
     EVENT_SESSION_START,
     SCAN_INTERVAL_FALLBACK,
     SESSION_MIN_DURATION_SEC,
+    WS_COALESCE_SECONDS,
+    WS_PARSE_EXECUTOR_THRESHOLD,
 )
 from .errors import HarviaAuthError, HarviaConnectionError
 
@@ -30,11 +35,17 @@ _LOGGER = logging.getLogger(__name__)
 # Device is considered stale if no update received for this many seconds
 DEVICE_STALE_TIMEOUT = 600  # 10 minutes
 
+# Device is considered unavailable after this many polls without data
+DEVICE_MAX_POLL_FAILURES = 3
+
 # Temperature trend: keep last N readings for rate calculation
 TEMP_HISTORY_MAX = 10
 
+# Energy is accumulated in watt-nanoseconds to keep the hot path integer-only
+WNS_PER_KWH = 3_600 * 1_000_000_000 * 1_000
 
-@dataclass
+
+@dataclass(slots=True)
 class HarviaDeviceData:
     """Parsed data for a single Harvia device."""
 
@@ -68,16 +79,18 @@ class HarviaDeviceData:
     # Timers
     heat_up_time: int = 0
     remaining_time: int = 0
+    effective_remaining_time: int = 0  # remaining_time, 0 while inactive
     on_time: int = 360  # Default max time in minutes
 
     # Status
     status_codes: str | None = None
+    _last_status_codes_raw: Any = field(default=None, compare=False)
     door_open: bool = False
     heat_on: bool = False
 
     # Telemetry
     wifi_rssi: int | None = None
-    timestamp: str | None = None
+    timestamp: str | None = field(default=None, compare=False)
 
     # Relay counters (for diagnostics)
     ph1_relay_counter: int = 0
@@ -96,18 +109,21 @@ class HarviaDeviceData:
     # Power / Energy (calculated)
     heater_power: int = 10800  # Nennleistung in Watt (wird aus Config überschrieben)
     heater_power_actual: int = 0  # Dynamic power from telemetry["heaterPower"]
-    energy_kwh: float = 0.0  # Kumulierter Energieverbrauch in kWh
-    _last_heat_on_timestamp: float | None = None  # Für Energy-Berechnung
-    _last_update: float = 0.0  # monotonic timestamp of last data received
+    current_power: int = 0  # heater_power while heating, else 0
+    energy_wns: int = 0  # Kumulierter Energieverbrauch in Watt-Nanosekunden
+    # Private bookkeeping is excluded from __eq__ so that only observable
+    # changes count for the coordinator's always_update=False check.
+    _last_heat_on_ns: int | None = field(default=None, compare=False)  # Für Energy-Berechnung
+    _last_update: float = field(default=0.0, compare=False)  # monotonic timestamp of last data received
 
     # Session tracking
-    _session_active: bool = False
-    _session_start_time: float | None = None
-    _session_max_temp: float = 0.0
+    _session_active: bool = field(default=False, compare=False)
+    _session_start_time: float | None = field(default=None, compare=False)
+    _session_max_temp: float = field(default=0.0, compare=False)
     last_session_duration: float = 0.0  # Minuten
     last_session_max_temp: float = 0.0  # °C
     sessions_today: int = 0
-    _sessions_today_date: str = ""  # ISO date string for reset
+    _sessions_today_date: str = field(default="", compare=False)  # ISO date string for reset
 
     # Usage statistics (lifetime totals) - Fenix-specific
     total_sessions: int = 0  # From telemetry["totalSessions"]
@@ -129,12 +145,28 @@ class HarviaDeviceData:
 
     # Temperature trend (°C/min)
     _temp_history: deque = field(
-        default_factory=lambda: deque(maxlen=TEMP_HISTORY_MAX)
+        default_factory=lambda: deque(maxlen=TEMP_HISTORY_MAX), compare=False
     )
     temp_trend: float | None = None  # °C/min
 
+    @property
+    def energy_kwh(self) -> float:
+        """Return the accumulated energy consumption in kWh."""
+        return self.energy_wns / WNS_PER_KWH
 
-@dataclass
+    @energy_kwh.setter
+    def energy_kwh(self, value: float) -> None:
+        """Set the accumulated energy consumption from kWh."""
+        self.energy_wns = round(value * WNS_PER_KWH)
+
+
+# Timestamps and session state, carried over when a poll changed nothing else
+_BOOKKEEPING_FIELDS = tuple(
+    f.name for f in fields(HarviaDeviceData) if not f.compare
+)
+
+
+@dataclass(slots=True)
 class HarviaSaunaData:
     """Container for all Harvia data."""
 
@@ -165,20 +197,41 @@ class HarviaSaunaCoordinator(DataUpdateCoordinator[HarviaSaunaData]):
             config_entry=config_entry,
             # Fallback polling - WebSocket is primary
             update_interval=timedelta(seconds=SCAN_INTERVAL_FALLBACK),
+            # Polls that change nothing don't notify entities
+            always_update=False,
         )
         self.api = api
+        self.platforms_loaded = False
+        # Set while push updates are healthy and polling is paused
+        self._push_healthy = False
+        self._poll_failures: dict[str, int] = {}
+        self._token_refresh_task: asyncio.Task | None = None
+        self._pending_notify: asyncio.TimerHandle | None = None
 
     async def async_setup(self) -> None:
-        """Set up real-time push updates if supported by the provider."""
-        await self.api.async_start_push_updates(self._async_handle_ws_update)
+        """Set up token refresh and real-time push updates."""
+        self._token_refresh_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self.api.async_token_refresh_loop(),
+            "harvia_token_refresh",
+        )
+        await self.api.async_start_push_updates(
+            self._async_handle_ws_update, self._async_update_polling
+        )
 
     async def async_shutdown(self) -> None:
-        """Shut down push update connections."""
+        """Shut down token refresh and push update connections."""
+        if self._token_refresh_task is not None:
+            self._token_refresh_task.cancel()
+            self._token_refresh_task = None
+        if self._pending_notify is not None:
+            self._pending_notify.cancel()
+            self._pending_notify = None
         await self.api.async_stop_push_updates()
 
     @property
     def websocket_connected(self) -> bool:
-        """Return True if any push connection is active."""
+        """Return True if push updates are subscribed on every feed."""
         return self.api.push_connected
 
     @property
@@ -190,34 +243,56 @@ class HarviaSaunaCoordinator(DataUpdateCoordinator[HarviaSaunaData]):
         """Fetch data via REST API (fallback polling)."""
         _LOGGER.debug("Polling: fetching data from REST APIs")
         try:
-            device_list = await self.api.async_get_devices()
+            snapshot = await self.api.async_get_devices_snapshot()
             data = HarviaSaunaData()
-
-            for device_entry in device_list:
-                device_id = device_entry["device_id"]
-
-                # Fetch both state and latest telemetry
-                state = await self.api.async_get_device_state(device_id)
-                telemetry = await self.api.async_get_latest_device_data(device_id)
-
-                # Preserve session data from previous cycle
-                if (
-                    self.data
-                    and device_id in self.data.devices
-                ):
-                    device_data = self.data.devices[device_id]
+            kept_previous = False
+            recovered = False
+
+            for device_id, (state, telemetry) in snapshot.items():
+                previous = self.data.devices.get(device_id) if self.data else None
+                if state is None and telemetry is None:
+                    # Keep last known data; the device turns unavailable
+                    # once it failed DEVICE_MAX_POLL_FAILURES polls in a row.
+                    failures = self._poll_failures.get(device_id, 0) + 1
+                    self._poll_failures[device_id] = failures
+                    _LOGGER.debug(
+                        "Polling: no data for device %s (%d in a row)",
+                        device_id, failures,
+                    )
+                    if previous is not None:
+                        data.devices[device_id] = previous
+                        kept_previous = True
+                    continue
+                if self._poll_failures.pop(device_id, 0) >= DEVICE_MAX_POLL_FAILURES:
+                    recovered = True
+
+                # Preserve session data from previous cycle. Work on a copy
+                # so the previous data stays intact for the change check.
+                if previous is not None:
+                    device_data = _copy_device_data(previous)
                 else:
                     device_data = HarviaDeviceData(device_id=device_id)
 
-                _apply_state_data(device_data, state)
-                _apply_telemetry_data(device_data, telemetry)
+                if state is not None:
+                    _apply_state_data(device_data, state)
+                if telemetry is not None:
+                    _apply_telemetry_data(device_data, telemetry)
                 _update_session_tracking(self.hass, device_data)
                 _update_temp_trend(device_data)
 
+                if device_data == previous:
+                    # Keep the object entities and commands already hold;
+                    # unchanged polls don't notify them of a new one
+                    _copy_bookkeeping(device_data, previous)
+                    device_data = previous
                 data.devices[device_id] = device_data
 
             data.available = True
             _LOGGER.debug("Polling: successfully updated %d devices", len(data.devices))
+            self._async_update_polling(data)
+            if kept_previous or recovered:
+                # Unchanged data doesn't notify; re-evaluate availability
+                self.async_schedule_notify()
             return data
 
         except HarviaAuthError as err:
@@ -242,32 +317,91 @@ class HarviaSaunaCoordinator(DataUpdateCoordinator[HarviaSaunaData]):
             if "onStateUpdated" in payload_data:
                 reported = payload_data["onStateUpdated"].get("reported")
                 if reported:
-                    state = json.loads(reported)
+                    state = await self._async_decode(reported)
                     device_id = state.get("deviceId")
                     if device_id and device_id in self.data.devices:
                         device = self.data.devices[device_id]
-                        _apply_state_data(device, state)
+                        # A stale device must be notified to become available
+                        stale = self.is_device_stale(device_id)
+                        self._poll_failures.pop(device_id, None)
+                        sessions = device.sessions_today
+                        changed = _apply_state_data(device, state)
                         _update_session_tracking(self.hass, device)
-                        updated = True
+                        updated = (
+                            changed
+                            or stale
+                            or device.sessions_today != sessions
+                        )
 
             elif "onDataUpdates" in payload_data:
                 item = payload_data["onDataUpdates"].get("item", {})
                 device_id = item.get("deviceId")
                 if device_id and device_id in self.data.devices:
-                    telemetry = json.loads(item.get("data", "{}"))
+                    telemetry = await self._async_decode(item.get("data", "{}"))
                     telemetry["timestamp"] = item.get("timestamp")
                     device = self.data.devices[device_id]
-                    _apply_telemetry_data(device, telemetry)
+                    stale = self.is_device_stale(device_id)
+                    self._poll_failures.pop(device_id, None)
+                    sessions = device.sessions_today
+                    trend = device.temp_trend
+                    changed = _apply_telemetry_data(device, telemetry)
                     _update_session_tracking(self.hass, device)
                     _update_temp_trend(device)
-                    updated = True
+                    updated = (
+                        changed
+                        or stale
+                        or device.sessions_today != sessions
+                        or device.temp_trend != trend
+                    )
 
             if updated:
-                self.async_set_updated_data(self.data)
+                self.async_schedule_notify()
 
         except Exception as err:
             _LOGGER.exception("Unexpected error handling WebSocket update: %s", err)
 
+    async def _async_decode(self, payload: str | dict[str, Any]) -> dict[str, Any]:
+        """Decode a push payload, parsing very large ones off the event loop."""
+        # Providers that already decoded the payload pass a dict
+        if isinstance(payload, dict):
+            return payload
+        if len(payload) > WS_PARSE_EXECUTOR_THRESHOLD:
+            return await self.hass.async_add_executor_job(orjson.loads, payload)
+        return orjson.loads(payload)
+
+    @callback
+    def _async_update_polling(self, data: HarviaSaunaData | None = None) -> None:
+        """Poll only while push updates are down or no device is known yet."""
+        data = data or self.data
+        self._push_healthy = bool(self.api.push_connected and data and data.devices)
+        if self._push_healthy:
+            if self.update_interval is not None:
+                _LOGGER.debug("Push connected, pausing fallback polling")
+                self.update_interval = None
+                self._async_unsub_refresh()
+        elif self.update_interval is None:
+            _LOGGER.debug("Push disconnected, resuming fallback polling")
+            self.update_interval = timedelta(seconds=SCAN_INTERVAL_FALLBACK)
+            # Poll right away, idle devices may not have updated in a while
+            self.config_entry.async_create_background_task(
+                self.hass, self.async_request_refresh(), "harvia_resume_polling"
+            )
+
+    @callback
+    def async_schedule_notify(self) -> None:
+        """Notify listeners once for a burst of push updates."""
+        if self._pending_notify is None:
+            self._pending_notify = self.hass.loop.call_later(
+                WS_COALESCE_SECONDS, self._flush_notify
+            )
+
+    @callback
+    def _flush_notify(self) -> None:
+        """Push coalesced updates to listeners."""
+        self._pending_notify = None
+        if self.data:
+            self.async_set_updated_data(self.data)
+
     async def async_request_state_change(
         self, device_id: str, payload: dict[str, Any]
     ) -> None:
@@ -283,12 +417,30 @@ class HarviaSaunaCoordinator(DataUpdateCoordinator[HarviaSaunaData]):
         """Check if a device has not received updates recently."""
         if not self.data or device_id not in self.data.devices:
             return True
+        if self._poll_failures.get(device_id, 0) >= DEVICE_MAX_POLL_FAILURES:
+            return True
+        if self._push_healthy:
+            return False  # Idle devices send no pushes while polling is paused
         device = self.data.devices[device_id]
         if device._last_update == 0.0:
             return False  # No update yet, trust initial data
         return (time.monotonic() - device._last_update) > DEVICE_STALE_TIMEOUT
 
 
+def _copy_bookkeeping(source: HarviaDeviceData, target: HarviaDeviceData) -> None:
+    """Copy the fields excluded from comparison onto another device object."""
+    for name in _BOOKKEEPING_FIELDS:
+        setattr(target, name, getattr(source, name))
+
+
+def _copy_device_data(device: HarviaDeviceData) -> HarviaDeviceData:
+    """Return a copy of device data that shares no mutable state."""
+    return replace(
+        device,
+        _temp_history=deque(device._temp_history, maxlen=TEMP_HISTORY_MAX),
+    )
+
+
 def _to_bool(value: Any) -> bool:
     """Convert various value types to boolean.
     
@@ -311,153 +463,187 @@ def _to_bool(value: Any) -> bool:
     return bool(value)
 
 
-def _apply_state_data(device: HarviaDeviceData, data: dict[str, Any]) -> None:
-    """Apply device state (reported) data to the device object."""
-    if "displayName" in data:
-        device.display_name = data["displayName"]
-    if "deviceId" in data:
-        device.device_id = data["deviceId"]
-    if "active" in data:
-        device.active = _to_bool(data["active"])
-    if "light" in data:
-        val = data["light"]
-        if isinstance(val, dict):
-            val = val.get("on", False)
-        device.lights_on = _to_bool(val)
-    if "fan" in data:
-        val = data["fan"]
-        if isinstance(val, dict):
-            val = val.get("on", False)
-        device.fan_on = _to_bool(val)
-    if "steamEn" in data:
-        device.steam_enabled = _to_bool(data["steamEn"])
-    if "targetTemp" in data:
-        device.target_temp = data["targetTemp"]
-    if "targetRh" in data:
-        device.target_rh = data["targetRh"]
-    if "heatUpTime" in data:
-        device.heat_up_time = data["heatUpTime"]
-    if "onTime" in data:
-        device.on_time = data["onTime"]
-    if "dehumEn" in data:
-        device.dehumidifier_enabled = _to_bool(data["dehumEn"])
-    if "autoLight" in data:
-        device.auto_light = _to_bool(data["autoLight"])
-    if "autoFan" in data:
-        device.auto_fan = _to_bool(data["autoFan"])
-    if "tempUnit" in data:
-        device.temp_unit = data["tempUnit"]
-    if "aromaEn" in data:
-        device.aroma_enabled = _to_bool(data["aromaEn"])
-    if "aromaLevel" in data:
-        device.aroma_level = data["aromaLevel"]
-    if "statusCodes" in data:
-        device.status_codes = str(data["statusCodes"])
-        # Parse door status from status codes (2nd digit = 9 means door open)
-        try:
-            device.door_open = int(str(data["statusCodes"])[1]) == 9
-        except (IndexError, ValueError):
-            pass
-    if "fwVersion" in data:
-        device.firmware_version = str(data["fwVersion"])
-    elif "swVersion" in data:
-        device.firmware_version = str(data["swVersion"])
-
+def _unwrap_on(value: Any) -> Any:
+    """Return the "on" flag of nested {"on": ...} structures."""
+    if isinstance(value, dict):
+        return value.get("on", False)
+    return value
+
+
+def _on_to_bool(value: Any) -> bool:
+    """Convert a possibly nested on/off value to boolean."""
+    return _to_bool(_unwrap_on(value))
+
+
+def _on_bool(value: Any) -> bool:
+    """Convert a possibly nested on/off value with plain truthiness."""
+    return bool(_unwrap_on(value))
+
+
+# JSON key -> (HarviaDeviceData attribute, converter or None for raw value)
+_STATE_MAP: dict[str, tuple[str, Callable[[Any], Any] | None]] = {
+    "displayName": ("display_name", None),
+    "deviceId": ("device_id", None),
+    "active": ("active", _to_bool),
+    "light": ("lights_on", _on_to_bool),
+    "fan": ("fan_on", _on_to_bool),
+    "steamEn": ("steam_enabled", _to_bool),
+    "targetTemp": ("target_temp", None),
+    "targetRh": ("target_rh", None),
+    "heatUpTime": ("heat_up_time", None),
+    "onTime": ("on_time", None),
+    "dehumEn": ("dehumidifier_enabled", _to_bool),
+    "autoLight": ("auto_light", _to_bool),
+    "autoFan": ("auto_fan", _to_bool),
+    "tempUnit": ("temp_unit", None),
+    "aromaEn": ("aroma_enabled", _to_bool),
+    "aromaLevel": ("aroma_level", None),
     # New Fenix-specific state fields
-    if "activeProfile" in data:
-        device.active_profile = data["activeProfile"]
-    if "saunaStatus" in data:
-        device.sauna_status = data["saunaStatus"]
-    if "remoteAllowed" in data:
-        device.remote_allowed = bool(data["remoteAllowed"])
-    if "demoMode" in data:
-        device.demo_mode = bool(data["demoMode"])
-    if "screenLock" in data:
-        # Handle nested structure if present
-        if isinstance(data["screenLock"], dict):
-            device.screen_lock = bool(data["screenLock"].get("on", False))
-        else:
-            device.screen_lock = bool(data["screenLock"])
+    "activeProfile": ("active_profile", None),
+    "saunaStatus": ("sauna_status", None),
+    "remoteAllowed": ("remote_allowed", bool),
+    "demoMode": ("demo_mode", bool),
+    "screenLock": ("screen_lock", _on_bool),
+}
+
+# Relay and on-time counters, copied unchanged
+_RELAY_COUNTER_MAP: tuple[tuple[str, str], ...] = (
+    ("ph1RelayCounter", "ph1_relay_counter"),
+    ("ph2RelayCounter", "ph2_relay_counter"),
+    ("ph3RelayCounter", "ph3_relay_counter"),
+    ("ph1RelayCounterLT", "ph1_relay_counter_lt"),
+    ("ph2RelayCounterLT", "ph2_relay_counter_lt"),
+    ("ph3RelayCounterLT", "ph3_relay_counter_lt"),
+    ("steamOnCounter", "steam_on_counter"),
+    ("steamOnCounterLT", "steam_on_counter_lt"),
+    ("heatOnCounter", "heat_on_counter"),
+    ("heatOnCounterLT", "heat_on_counter_lt"),
+)
 
+_TELEMETRY_MAP: dict[str, tuple[str, Callable[[Any], Any] | None]] = {
+    "temperature": ("current_temp", None),
+    "humidity": ("humidity", None),
+    "steamOn": ("steam_on", bool),
+    "remainingTime": ("remaining_time", None),
+    "targetTemp": ("target_temp", None),
+    "wifiRSSI": ("wifi_rssi", None),
+    # Relay counters
+    **{key: (attr, None) for key, attr in _RELAY_COUNTER_MAP},
+    # New Fenix-specific telemetry fields
+    "heaterPower": ("heater_power_actual", None),
+    "mainSensorTemp": ("main_sensor_temp", None),
+    "extSensorTemp": ("ext_sensor_temp", None),
+    "panelTemp": ("panel_temp", None),
+    "totalSessions": ("total_sessions", None),
+    "totalBathingHours": ("total_bathing_hours", None),
+    "totalHours": ("total_hours", None),
+    "afterHeatTime": ("after_heat_time", None),
+    "ontimeLT": ("ontime_lt", None),
+    "safetyRelay": ("safety_relay", bool),
+    # Real-time light and fan status from telemetry (overrides state if present)
+    "lightOn": ("lights_on", bool),
+    "fanOn": ("fan_on", bool),
+}
+
+
+def update_derived_values(device: HarviaDeviceData) -> bool:
+    """Precompute values that sensors would otherwise derive on every read.
+
+    Returns True if any derived value changed.
+    """
+    remaining = device.remaining_time if device.active else 0
+    power = device.heater_power if device.heat_on else 0
+    if (
+        remaining == device.effective_remaining_time
+        and power == device.current_power
+    ):
+        return False
+    device.effective_remaining_time = remaining
+    device.current_power = power
+    return True
+
+
+def _apply_mapped(
+    device: HarviaDeviceData,
+    data: dict[str, Any],
+    mapping: dict[str, tuple[str, Callable[[Any], Any] | None]],
+) -> bool:
+    """Copy the keys present in data onto the device via a dispatch table.
+
+    Returns True if any attribute changed.
+    """
+    changed = False
+    for key, value in data.items():
+        handler = mapping.get(key)
+        if handler is None:
+            continue
+        attr, convert = handler
+        if convert is not None:
+            value = convert(value)
+        if getattr(device, attr) != value:
+            setattr(device, attr, value)
+            changed = True
+    return changed
+
+
+def _apply_state_data(device: HarviaDeviceData, data: dict[str, Any]) -> bool:
+    """Apply device state (reported) data to the device object.
+
+    Returns True if any observable value changed.
+    """
+    changed = _apply_mapped(device, data, _STATE_MAP)
+
+    if "statusCodes" in data:
+        raw = data["statusCodes"]
+        # Status codes rarely change, only reparse when they do
+        if raw != device._last_status_codes_raw:
+            device._last_status_codes_raw = raw
+            codes = sys.intern(str(raw))
+            device.status_codes = codes
+            # Parse door status from status codes (2nd digit = 9 means door open)
+            if len(codes) > 1:
+                device.door_open = codes[1] == "9"
+            changed = True
+    # Few distinct versions exist, share one string instead of one per push
+    version = data.get("fwVersion", data.get("swVersion"))
+    if version is not None:
+        version = sys.intern(str(version))
+        if version != device.firmware_version:
+            device.firmware_version = version
+            changed = True
+
+    changed |= update_derived_values(device)
     device._last_update = time.monotonic()
+    return changed
 
 
-def _apply_telemetry_data(device: HarviaDeviceData, data: dict[str, Any]) -> None:
-    """Apply telemetry (sensor) data to the device object."""
-    if "temperature" in data:
-        device.current_temp = data["temperature"]
-    if "humidity" in data:
-        device.humidity = data["humidity"]
-    if "heatOn" in data:
-        was_heating = device.heat_on
-        device.heat_on = bool(data["heatOn"])
-
-        # Energy calculation: accumulate kWh while heating
-        now = time.monotonic()
-        if was_heating and device._last_heat_on_timestamp is not None:
-            elapsed_hours = (now - device._last_heat_on_timestamp) / 3600.0
-            device.energy_kwh += (device.heater_power / 1000.0) * elapsed_hours
-
-        if device.heat_on:
-            device._last_heat_on_timestamp = now
-        else:
-            device._last_heat_on_timestamp = None
-
-    if "steamOn" in data:
-        device.steam_on = bool(data["steamOn"])
-    if "remainingTime" in data:
-        device.remaining_time = data["remainingTime"]
-    if "targetTemp" in data:
-        device.target_temp = data["targetTemp"]
-    if "wifiRSSI" in data:
-        device.wifi_rssi = data["wifiRSSI"]
+def _apply_telemetry_data(device: HarviaDeviceData, data: dict[str, Any]) -> bool:
+    """Apply telemetry (sensor) data to the device object.
+
+    Returns True if any observable value changed.
+    """
+    changed = _apply_mapped(device, data, _TELEMETRY_MAP)
     if "timestamp" in data:
         device.timestamp = data["timestamp"]
 
-    # Relay counters
-    for key, attr in [
-        ("ph1RelayCounter", "ph1_relay_counter"),
-        ("ph2RelayCounter", "ph2_relay_counter"),
-        ("ph3RelayCounter", "ph3_relay_counter"),
-        ("ph1RelayCounterLT", "ph1_relay_counter_lt"),
-        ("ph2RelayCounterLT", "ph2_relay_counter_lt"),
-        ("ph3RelayCounterLT", "ph3_relay_counter_lt"),
-        ("steamOnCounter", "steam_on_counter"),
-        ("steamOnCounterLT", "steam_on_counter_lt"),
-        ("heatOnCounter", "heat_on_counter"),
-        ("heatOnCounterLT", "heat_on_counter_lt"),
-    ]:
-        if key in data:
-            setattr(device, attr, data[key])
+    if "heatOn" in data:
+        was_heating = device.heat_on
+        heat_on = bool(data["heatOn"])
+        device.heat_on = heat_on
+        changed = changed or heat_on != was_heating
 
-    # New Fenix-specific telemetry fields
-    if "heaterPower" in data:
-        device.heater_power_actual = data["heaterPower"]
-    if "mainSensorTemp" in data:
-        device.main_sensor_temp = data["mainSensorTemp"]
-    if "extSensorTemp" in data:
-        device.ext_sensor_temp = data["extSensorTemp"]
-    if "panelTemp" in data:
-        device.panel_temp = data["panelTemp"]
-    if "totalSessions" in data:
-        device.total_sessions = data["totalSessions"]
-    if "totalBathingHours" in data:
-        device.total_bathing_hours = data["totalBathingHours"]
-    if "totalHours" in data:
-        device.total_hours = data["totalHours"]
-    if "afterHeatTime" in data:
-        device.after_heat_time = data["afterHeatTime"]
-    if "ontimeLT" in data:
-        device.ontime_lt = data["ontimeLT"]
-    if "safetyRelay" in data:
-        device.safety_relay = bool(data["safetyRelay"])
-    # Real-time light and fan status from telemetry (overrides state if present)
-    if "lightOn" in data:
-        device.lights_on = bool(data["lightOn"])
-    if "fanOn" in data:
-        device.fan_on = bool(data["fanOn"])
+        # Energy calculation: accumulate watt-nanoseconds while heating
+        now_ns = time.monotonic_ns()
+        last_ns = device._last_heat_on_ns
+        if was_heating and last_ns is not None:
+            device.energy_wns += device.heater_power * (now_ns - last_ns)
+            changed = True
+
+        device._last_heat_on_ns = now_ns if heat_on else None
 
+    changed |= update_derived_values(device)
     device._last_update = time.monotonic()
+    return changed
 
 
 def _update_session_tracking(
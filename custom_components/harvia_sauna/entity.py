@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -12,7 +15,12 @@ from .const import (
     HEATER_MODELS,
     MANUFACTURER,
 )
-from .coordinator import HarviaDeviceData, HarviaSaunaCoordinator, HarviaSaunaData
+from .coordinator import (
+    HarviaDeviceData,
+    HarviaSaunaCoordinator,
+    HarviaSaunaData,
+    update_derived_values,
+)
 
 
 class HarviaBaseEntity(CoordinatorEntity[HarviaSaunaCoordinator]):
@@ -29,11 +37,12 @@ class HarviaBaseEntity(CoordinatorEntity[HarviaSaunaCoordinator]):
         """Initialize the entity."""
         super().__init__(coordinator)
         self._device_id = device_id
+        self._device_data = self._lookup_device_data()
         self._attr_unique_id = f"{device_id}_{entity_key}"
+        self._attr_device_info = self._build_device_info()
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
+    def _build_device_info(self) -> DeviceInfo:
+        """Build device information once for the entity lifetime."""
         device_data = self._get_device_data()
 
         # Get heater model and power from config entry
@@ -61,14 +70,44 @@ class HarviaBaseEntity(CoordinatorEntity[HarviaSaunaCoordinator]):
         """Return if entity is available."""
         return (
             super().available
-            and self.coordinator.data is not None
+            and self._device_data is not None
             and self.coordinator.data.available
-            and self._device_id in self.coordinator.data.devices
             and not self.coordinator.is_device_stale(self._device_id)
         )
 
-    def _get_device_data(self) -> HarviaDeviceData | None:
-        """Get the device data for this entity."""
+    async def async_added_to_hass(self) -> None:
+        """Refresh the cached device when added to hass."""
+        await super().async_added_to_hass()
+        self._refresh_device_data()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached device before writing state."""
+        self._refresh_device_data()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_apply_optimistic(self, **changes: Any) -> None:
+        """Apply a commanded change before the device confirms it."""
+        if (device := self._get_device_data()) is None:
+            return
+        for attr, value in changes.items():
+            setattr(device, attr, value)
+        update_derived_values(device)
+        # The device object is shared, one coalesced notify updates siblings too
+        self.coordinator.async_schedule_notify()
+
+    @callback
+    def _refresh_device_data(self) -> None:
+        """Cache the device object, polls replace it with a new copy."""
+        self._device_data = self._lookup_device_data()
+
+    def _lookup_device_data(self) -> HarviaDeviceData | None:
+        """Look up the device data for this entity in the coordinator."""
         if self.coordinator.data is None:
             return None
         return self.coordinator.data.devices.get(self._device_id)
+
+    def _get_device_data(self) -> HarviaDeviceData | None:
+        """Get the cached device data for this entity."""
+        return self._device_data
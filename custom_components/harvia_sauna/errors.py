@@ -1,5 +1,7 @@
 """Shared exceptions for Harvia API clients."""
 
+from typing import Any
+
 
 class HarviaAuthError(Exception):
     """Authentication failed."""
@@ -7,3 +9,13 @@ class HarviaAuthError(Exception):
 
 class HarviaConnectionError(Exception):
     """Connection to API failed."""
+
+
+def raise_first_error(results: list[Any]) -> None:
+    """Re-raise an exception collected by gather, auth errors first."""
+    errors = [result for result in results if isinstance(result, BaseException)]
+    for error in errors:
+        if isinstance(error, HarviaAuthError):
+            raise error
+    if errors:
+        raise errors[0]
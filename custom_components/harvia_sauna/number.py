@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
+from operator import attrgetter
 from typing import Callable
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription
@@ -40,7 +41,7 @@ NUMBER_DESCRIPTIONS: list[HarviaNumberDescription] = [
         entity_registry_enabled_default=False,
         api_key="targetRh",
         state_attr="target_rh",
-        value_fn=lambda d: d.target_rh,
+        value_fn=attrgetter("target_rh"),
     ),
     HarviaNumberDescription(
         key="aroma_level",
@@ -53,7 +54,7 @@ NUMBER_DESCRIPTIONS: list[HarviaNumberDescription] = [
         entity_registry_enabled_default=False,
         api_key="aromaLevel",
         state_attr="aroma_level",
-        value_fn=lambda d: d.aroma_level,
+        value_fn=attrgetter("aroma_level"),
     ),
     HarviaNumberDescription(
         key="on_time",
@@ -65,7 +66,7 @@ NUMBER_DESCRIPTIONS: list[HarviaNumberDescription] = [
         icon="mdi:timer-cog",
         api_key="onTime",
         state_attr="on_time",
-        value_fn=lambda d: d.on_time,
+        value_fn=attrgetter("on_time"),
     ),
 ]
 
@@ -78,14 +79,13 @@ async def async_setup_entry(
     """Set up Harvia number entities."""
     coordinator: HarviaSaunaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for device_id in coordinator.data.devices:
-        for description in NUMBER_DESCRIPTIONS:
-            entities.append(
-                HarviaNumber(coordinator, device_id, description)
-            )
-
-    async_add_entities(entities)
+    async_add_entities(
+        [
+            HarviaNumber(coordinator, device_id, description)
+            for device_id in coordinator.data.devices
+            for description in NUMBER_DESCRIPTIONS
+        ]
+    )
 
 
 class HarviaNumber(HarviaBaseEntity, NumberEntity):
@@ -116,8 +116,6 @@ class HarviaNumber(HarviaBaseEntity, NumberEntity):
         await self.coordinator.async_request_state_change(
             self._device_id, {self.entity_description.api_key: int(value)}
         )
-        # Optimistic update
-        device = self._get_device_data()
-        if device:
-            setattr(device, self.entity_description.state_attr, int(value))
-            self.async_write_ha_state()
+        self._async_apply_optimistic(
+            **{self.entity_description.state_attr: int(value)}
+        )
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import logging
+from operator import attrgetter
 from typing import Callable
 
 from homeassistant.components.sensor import (
@@ -49,7 +50,7 @@ SENSOR_DESCRIPTIONS: list[HarviaSensorDescription] = [
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:thermometer",
-        value_fn=lambda d: d.current_temp,
+        value_fn=attrgetter("current_temp"),
     ),
     HarviaSensorDescription(
         key="humidity",
@@ -59,7 +60,7 @@ SENSOR_DESCRIPTIONS: list[HarviaSensorDescription] = [
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:water-percent",
         entity_registry_enabled_default=False,
-        value_fn=lambda d: d.humidity,
+        value_fn=attrgetter("humidity"),
     ),
     HarviaSensorDescription(
         key="target_temperature",
@@ -67,7 +68,7 @@ SENSOR_DESCRIPTIONS: list[HarviaSensorDescription] = [
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         icon="mdi:thermometer-chevron-up",
-        value_fn=lambda d: d.target_temp,
+        value_fn=attrgetter("target_temp"),
     ),
     HarviaSensorDescription(
         key="remaining_time",
@@ -75,7 +76,7 @@ SENSOR_DESCRIPTIONS: list[HarviaSensorDescription] = [
         native_unit_of_measurement=UnitOfTime.MINUTES,
         device_class=SensorDeviceClass.DURATION,
         icon="mdi:timer-sand",
-        value_fn=lambda d: d.remaining_time if d.active else 0,
+        value_fn=attrgetter("effective_remaining_time"),
     ),
     HarviaSensorDescription(
         key="heat_up_time",
@@ -83,7 +84,7 @@ SENSOR_DESCRIPTIONS: list[HarviaSensorDescription] = [
         native_unit_of_measurement=UnitOfTime.MINUTES,
         device_class=SensorDeviceClass.DURATION,
         icon="mdi:timer-alert",
-        value_fn=lambda d: d.heat_up_time,
+        value_fn=attrgetter("heat_up_time"),
     ),
     HarviaSensorDescription(
         key="wifi_rssi",
@@ -94,7 +95,7 @@ SENSOR_DESCRIPTIONS: list[HarviaSensorDescription] = [
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:wifi",
         entity_registry_enabled_default=False,
-        value_fn=lambda d: d.wifi_rssi,
+        value_fn=attrgetter("wifi_rssi"),
     ),
     HarviaSensorDescription(
         key="status_codes",
@@ -102,7 +103,7 @@ SENSOR_DESCRIPTIONS: list[HarviaSensorDescription] = [
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:information-outline",
         entity_registry_enabled_default=False,
-        value_fn=lambda d: d.status_codes,
+        value_fn=attrgetter("status_codes"),
     ),
     HarviaSensorDescription(
         key="aroma_level",
@@ -111,7 +112,7 @@ SENSOR_DESCRIPTIONS: list[HarviaSensorDescription] = [
         icon="mdi:flower",
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda d: d.aroma_level,
+        value_fn=attrgetter("aroma_level"),
     ),
     # Diagnostic counters (Lifetime values)
     HarviaSensorDescription(
@@ -180,7 +181,7 @@ SENSOR_DESCRIPTIONS: list[HarviaSensorDescription] = [
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:flash",
-        value_fn=lambda d: d.heater_power if d.heat_on else 0,
+        value_fn=attrgetter("current_power"),
     ),
     HarviaSensorDescription(
         key="energy",
@@ -189,7 +190,7 @@ SENSOR_DESCRIPTIONS: list[HarviaSensorDescription] = [
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:lightning-bolt",
-        value_fn=lambda d: d.energy_kwh,
+        value_fn=attrgetter("energy_kwh"),
     ),
     # New Fenix-specific sensors
     HarviaSensorDescription(
@@ -213,7 +214,7 @@ SENSOR_DESCRIPTIONS: list[HarviaSensorDescription] = [
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         providers=(API_PROVIDER_HARVIAIO,),
-        value_fn=lambda d: d.main_sensor_temp,
+        value_fn=attrgetter("main_sensor_temp"),
     ),
     HarviaSensorDescription(
         key="ext_sensor_temp",
@@ -225,7 +226,7 @@ SENSOR_DESCRIPTIONS: list[HarviaSensorDescription] = [
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         providers=(API_PROVIDER_HARVIAIO,),
-        value_fn=lambda d: d.ext_sensor_temp,
+        value_fn=attrgetter("ext_sensor_temp"),
     ),
     HarviaSensorDescription(
         key="panel_temp",
@@ -237,7 +238,7 @@ SENSOR_DESCRIPTIONS: list[HarviaSensorDescription] = [
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         providers=(API_PROVIDER_HARVIAIO,),
-        value_fn=lambda d: d.panel_temp,
+        value_fn=attrgetter("panel_temp"),
     ),
     HarviaSensorDescription(
         key="total_sessions",
@@ -302,7 +303,7 @@ SENSOR_DESCRIPTIONS: list[HarviaSensorDescription] = [
         translation_key="sessions_today",
         icon="mdi:counter",
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda d: d.sessions_today,
+        value_fn=attrgetter("sessions_today"),
     ),
     HarviaSensorDescription(
         key="temp_trend",
@@ -311,7 +312,7 @@ SENSOR_DESCRIPTIONS: list[HarviaSensorDescription] = [
         icon="mdi:trending-up",
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda d: d.temp_trend,
+        value_fn=attrgetter("temp_trend"),
     ),
 ]
 
@@ -328,27 +329,29 @@ async def async_setup_entry(
     coordinator: HarviaSaunaCoordinator = hass.data[DOMAIN][entry.entry_id]
     provider = entry.data.get(CONF_API_PROVIDER, API_PROVIDER_MYHARVIA)
 
-    entities = []
-    for device_id in coordinator.data.devices:
-        for description in SENSOR_DESCRIPTIONS:
-            # Skip entities not matching the configured API provider
-            if description.providers is not None and provider not in description.providers:
-                continue
-
-            if description.key == "energy":
-                entities.append(
-                    HarviaEnergySensor(coordinator, device_id, description)
-                )
-            elif description.key in RESTORABLE_SESSION_KEYS:
-                entities.append(
-                    HarviaSessionSensor(coordinator, device_id, description)
-                )
-            else:
-                entities.append(
-                    HarviaSensor(coordinator, device_id, description)
-                )
-
-    async_add_entities(entities)
+    # Resolve the entity class once per description, skipping entities
+    # not matching the configured API provider
+    descriptions = [
+        (_sensor_class(description), description)
+        for description in SENSOR_DESCRIPTIONS
+        if description.providers is None or provider in description.providers
+    ]
+    async_add_entities(
+        [
+            sensor_class(coordinator, device_id, description)
+            for device_id in coordinator.data.devices
+            for sensor_class, description in descriptions
+        ]
+    )
+
+
+def _sensor_class(description: HarviaSensorDescription) -> type[HarviaSensor]:
+    """Return the entity class for a sensor description."""
+    if description.key == "energy":
+        return HarviaEnergySensor
+    if description.key in RESTORABLE_SESSION_KEYS:
+        return HarviaSessionSensor
+    return HarviaSensor
 
 
 class HarviaSensor(HarviaBaseEntity, SensorEntity):
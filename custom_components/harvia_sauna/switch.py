@@ -109,14 +109,13 @@ async def async_setup_entry(
     """Set up Harvia switch entities."""
     coordinator: HarviaSaunaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = []
-    for device_id in coordinator.data.devices:
-        for description in SWITCH_DESCRIPTIONS:
-            entities.append(
-                HarviaSwitch(coordinator, device_id, description)
-            )
-
-    async_add_entities(entities)
+    async_add_entities(
+        [
+            HarviaSwitch(coordinator, device_id, description)
+            for device_id in coordinator.data.devices
+            for description in SWITCH_DESCRIPTIONS
+        ]
+    )
 
 
 class HarviaSwitch(HarviaBaseEntity, SwitchEntity):
@@ -133,6 +132,8 @@ class HarviaSwitch(HarviaBaseEntity, SwitchEntity):
         """Initialize the switch."""
         super().__init__(coordinator, device_id, description.key)
         self.entity_description = description
+        self._icon_on = description.icon_on or description.icon
+        self._icon_off = description.icon_off or description.icon
 
     @property
     def is_on(self) -> bool | None:
@@ -145,29 +146,22 @@ class HarviaSwitch(HarviaBaseEntity, SwitchEntity):
     @property
     def icon(self) -> str:
         """Return the icon based on state."""
-        desc = self.entity_description
-        if self.is_on:
-            return desc.icon_on or desc.icon
-        return desc.icon_off or desc.icon
+        return self._icon_on if self.is_on else self._icon_off
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         await self.coordinator.async_request_state_change(
             self._device_id, {self.entity_description.api_key: 1}
         )
-        # Optimistic update
-        device = self._get_device_data()
-        if device:
-            setattr(device, self.entity_description.state_attr, True)
-            self.async_write_ha_state()
+        self._async_apply_optimistic(
+            **{self.entity_description.state_attr: True}
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         await self.coordinator.async_request_state_change(
             self._device_id, {self.entity_description.api_key: 0}
         )
-        # Optimistic update
-        device = self._get_device_data()
-        if device:
-            setattr(device, self.entity_description.state_attr, False)
-            self.async_write_ha_state()
+        self._async_apply_optimistic(
+            **{self.entity_description.state_attr: False}
+        )
@@ -3,20 +3,92 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from collections import OrderedDict, deque
 import logging
+import os
 import random
-import ssl
-import uuid
+import time
 from typing import Any, Callable
 
+import orjson
 import websockets
 
+from homeassistant.core import callback
+from homeassistant.util.ssl import get_default_context
+
 from .api import HarviaApiClient
-from .const import WS_HEARTBEAT_TIMEOUT, WS_MAX_RECONNECT_DELAY, WS_RECONNECT_INTERVAL
+from .const import (
+    WS_CLOSE_TIMEOUT,
+    WS_HEARTBEAT_TIMEOUT,
+    WS_MAX_FRAME_SIZE,
+    WS_MAX_RECONNECT_DELAY,
+    WS_OPEN_TIMEOUT,
+    WS_RECONNECT_INTERVAL,
+    WS_STOP_TIMEOUT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Lower bound for reconnect delays in seconds
+_BASE_RECONNECT_DELAY = 1.0
+
+# Jitter values drawn once from OS entropy; each connection starts at a
+# random offset so the sockets never share a sequence
+_RANDOM = random.SystemRandom()
+_JITTER = tuple(_RANDOM.random() for _ in range(64))
+
+# Org and user sockets deliver the same update; forward it only once
+_DEDUPE_WINDOW = 10.0  # seconds
+_DEDUPE_SIZE = 256
+
+# Updates waiting for the coordinator; bounds memory if it falls behind
+_UPDATE_QUEUE_SIZE = 256
+
+# AppSync control frames as sent on the wire; subscription ids are hex
+_KA_FRAME = '{"type":"ka"}'
+_INIT_FRAME = '{"type":"connection_init"}'
+_STOP_FRAME = '{"id":"%s","type":"stop"}'
+
+_DATA_SUBSCRIPTION = (
+    "subscription Subscription($receiver: String!) {\n"
+    "  onDataUpdates(receiver: $receiver) {\n"
+    "    item {\n"
+    "      deviceId\n"
+    "      timestamp\n"
+    "      sessionId\n"
+    "      type\n"
+    "      data\n"
+    "      __typename\n"
+    "    }\n"
+    "    __typename\n"
+    "  }\n"
+    "}\n"
+)
+
+_DEVICE_SUBSCRIPTION = (
+    "subscription Subscription($receiver: String!) {\n"
+    "  onStateUpdated(receiver: $receiver) {\n"
+    "    desired\n"
+    "    reported\n"
+    "    timestamp\n"
+    "    receiver\n"
+    "    __typename\n"
+    "  }\n"
+    "}\n"
+)
+
+# Subscription ids are drawn in batches, one urandom read covers many reconnects
+_ID_BATCH = 16
+_ID_POOL: deque[str] = deque()
+
+
+def _next_subscription_id() -> str:
+    """Return a random 128-bit hex subscription id from the pool."""
+    if not _ID_POOL:
+        raw = os.urandom(16 * _ID_BATCH).hex()
+        _ID_POOL.extend(raw[i : i + 32] for i in range(0, len(raw), 32))
+    return _ID_POOL.popleft()
+
 
 class HarviaWebSocketManager:
     """Manages all WebSocket connections to MyHarvia Cloud."""
@@ -25,13 +97,19 @@ class HarviaWebSocketManager:
         self,
         api: HarviaApiClient,
         on_device_update: Callable[[dict], Any],
+        on_connection_change: Callable[[], None] | None = None,
     ) -> None:
         """Initialize the WebSocket manager."""
         self._api = api
         self._on_device_update = on_device_update
+        self._on_connection_change = on_connection_change
         self._connections: list[HarviaWebSocket] = []
         self._tasks: list[asyncio.Task] = []
         self._running = False
+        self._recent_updates: OrderedDict[int, float] = OrderedDict()
+        self._update_queue: asyncio.Queue[dict] = asyncio.Queue(
+            maxsize=_UPDATE_QUEUE_SIZE
+        )
 
     async def async_start(self) -> None:
         """Start all WebSocket connections."""
@@ -56,19 +134,22 @@ class HarviaWebSocketManager:
                 receiver=receiver,
                 is_user_receiver=is_user,
                 on_message=self._handle_message,
+                on_connection_change=self._on_connection_change,
             )
             self._connections.append(ws)
             task = asyncio.create_task(ws.async_run())
             self._tasks.append(task)
 
+        self._tasks.append(asyncio.create_task(self._async_consume_updates()))
+
         _LOGGER.debug("Started %d WebSocket connections", len(self._connections))
 
-    async def async_stop(self) -> None:
+    async def async_stop(self, graceful: bool = True) -> None:
         """Stop all WebSocket connections gracefully."""
         self._running = False
 
         for ws in self._connections:
-            await ws.async_stop()
+            await ws.async_stop(graceful)
 
         for task in self._tasks:
             task.cancel()
@@ -79,16 +160,54 @@ class HarviaWebSocketManager:
 
         self._connections.clear()
         self._tasks.clear()
+        while not self._update_queue.empty():
+            self._update_queue.get_nowait()
         _LOGGER.debug("All WebSocket connections stopped")
 
-    async def _handle_message(self, endpoint: str, message: dict) -> None:
-        """Route incoming WebSocket messages."""
-        msg_type = message.get("type")
+    @callback
+    def _handle_message(self, message: dict) -> None:
+        """Queue a data message from any connection for the shared consumer."""
+        # Connections only forward "data" frames; tolerate a missing payload
+        payload_data = (message.get("payload") or {}).get("data") or {}
+        if self._is_duplicate(payload_data):
+            return
+        try:
+            self._update_queue.put_nowait(payload_data)
+        except asyncio.QueueFull:
+            # Updates carry partial fields, so this one's values are lost
+            # until the device reports them again or the next poll
+            _LOGGER.warning(
+                "WebSocket update queue full (%d), dropping incoming update",
+                _UPDATE_QUEUE_SIZE,
+            )
 
-        if msg_type == "data":
-            payload_data = message.get("payload", {}).get("data", {})
+    async def _async_consume_updates(self) -> None:
+        """Forward queued updates to the coordinator in arrival order."""
+        # Bursts are not merged here: updates carry partial fields, and the
+        # coordinator already coalesces the resulting state writes
+        while True:
+            payload_data = await self._update_queue.get()
             await self._on_device_update(payload_data)
 
+    def _is_duplicate(self, payload_data: dict) -> bool:
+        """Return True if the same update was forwarded moments ago."""
+        # Frames differ in subscription id and receiver, so key on content
+        if state := payload_data.get("onStateUpdated"):
+            key = hash((state.get("reported"), state.get("timestamp")))
+        elif updates := payload_data.get("onDataUpdates"):
+            item = updates.get("item") or {}
+            key = hash((item.get("deviceId"), item.get("timestamp"), item.get("data")))
+        else:
+            return False
+
+        now = time.monotonic()
+        seen = self._recent_updates.get(key)
+        self._recent_updates[key] = now
+        self._recent_updates.move_to_end(key)
+        if len(self._recent_updates) > _DEDUPE_SIZE:
+            self._recent_updates.popitem(last=False)
+        return seen is not None and now - seen < _DEDUPE_WINDOW
+
 
 class HarviaWebSocket:
     """Single WebSocket connection to MyHarvia AppSync."""
@@ -99,7 +218,8 @@ class HarviaWebSocket:
         endpoint: str,
         receiver: str,
         is_user_receiver: bool,
-        on_message: Callable,
+        on_message: Callable[[dict], None],
+        on_connection_change: Callable[[], None] | None = None,
     ) -> None:
         """Initialize a WebSocket connection."""
         self._api = api
@@ -107,13 +227,40 @@ class HarviaWebSocket:
         self._receiver = receiver
         self._is_user_receiver = is_user_receiver
         self._on_message = on_message
+        self._on_connection_change = on_connection_change
         self._websocket = None
+        self._subscribed = False
         self._running = False
         self._reconnect_attempts = 0
-        self._subscription_id = str(uuid.uuid4())
+        self._prev_delay = _BASE_RECONNECT_DELAY
+        self._jitter_idx = _RANDOM.randrange(64)
+        self._timeout: float = WS_HEARTBEAT_TIMEOUT
+        self._last_recv = 0.0
+        self._reconnect_at = 0.0
+        self._watchdog: asyncio.TimerHandle | None = None
+        self._close_task: asyncio.Task | None = None
+        self._subscription_id = ""
+        self._ws_info: dict | None = None
         self._label = (
             f"{endpoint}({'user' if is_user_receiver else 'org'})"
         )
+        # Query and receiver never change, serialize them once
+        self._subscription_data = orjson.dumps(
+            {
+                "query": (
+                    _DATA_SUBSCRIPTION if endpoint == "data" else _DEVICE_SUBSCRIPTION
+                ),
+                "variables": {"receiver": receiver},
+            }
+        ).decode()
+        # Frame dispatch table; the usual "ka" frame is handled inline
+        self._handlers: dict[str, Callable[[dict], Any]] = {
+            "ka": self._on_heartbeat,
+            "connection_ack": self._async_on_ack,
+            "start_ack": self._on_start_ack,
+            "data": on_message,
+            "error": self._on_error,
+        }
 
     async def async_run(self) -> None:
         """Main WebSocket loop with automatic reconnection."""
@@ -135,20 +282,27 @@ class HarviaWebSocket:
                     )
                     # Reset backoff for auth errors - retry quickly after refresh
                     self._reconnect_attempts = 0
+                    self._prev_delay = _BASE_RECONNECT_DELAY
                 else:
                     _LOGGER.debug(
                         "WebSocket %s error: %s, reconnecting...",
                         self._label, err,
                     )
 
+            self._set_websocket(None)
             if not self._running:
                 break
 
-            # Exponential backoff with jitter
+            # Decorrelated jitter backoff keeps the sockets from reconnecting
+            # in lockstep after a cloud outage
+            jitter = _JITTER[self._jitter_idx & 63]
+            self._jitter_idx += 1
             delay = min(
-                2 ** self._reconnect_attempts + random.uniform(0, 1),
                 WS_MAX_RECONNECT_DELAY,
+                _BASE_RECONNECT_DELAY
+                + jitter * (self._prev_delay * 3 - _BASE_RECONNECT_DELAY),
             )
+            self._prev_delay = delay
             self._reconnect_attempts += 1
             _LOGGER.debug(
                 "WebSocket %s reconnecting in %.1fs (attempt %d)",
@@ -156,98 +310,160 @@ class HarviaWebSocket:
             )
             await asyncio.sleep(delay)
 
-    async def async_stop(self) -> None:
+    async def async_stop(self, graceful: bool = True) -> None:
         """Stop the WebSocket connection."""
         self._running = False
         if self._websocket:
+            # Send stop message before closing; during shutdown the server
+            # won't read it and the close frame suffices
+            if graceful:
+                try:
+                    await asyncio.wait_for(
+                        self._websocket.send(_STOP_FRAME % self._subscription_id),
+                        WS_STOP_TIMEOUT,
+                    )
+                except Exception:
+                    pass
             try:
-                # Send stop message before closing
-                stop_payload = {"id": self._subscription_id, "type": "stop"}
-                await self._websocket.send(json.dumps(stop_payload))
-                await self._websocket.close()
+                await self._websocket.close(code=1001)
             except Exception:
                 pass
             self._websocket = None
-
-    @staticmethod
-    def _create_ssl_context() -> ssl.SSLContext:
-        """Create SSL context (blocking, must run in executor)."""
-        ctx = ssl.create_default_context()
-        return ctx
+            self._subscribed = False
 
     async def _async_connect_and_listen(self) -> None:
         """Connect to WebSocket and listen for messages."""
-        ws_info = await self._api.async_get_websocket_info(self._endpoint)
+        # Host is static per endpoint, only the URL carries the expiring token
+        if self._ws_info is None:
+            self._ws_info = await self._api.async_get_websocket_info(self._endpoint)
         url = await self._api.async_get_websocket_url(self._endpoint)
 
-        self._subscription_id = str(uuid.uuid4())
-
-        # Create SSL context in executor to avoid blocking the event loop
+        self._subscription_id = _next_subscription_id()
         loop = asyncio.get_running_loop()
-        ssl_context = await loop.run_in_executor(None, self._create_ssl_context)
 
+        # Home Assistant's shared client context, already loaded at startup.
+        # Frames are small and uncompressed; keepalive is the protocol's "ka"
+        # frame, so the library's own pings stay off
         async with websockets.connect(
-            url, subprotocols=["graphql-ws"], ssl=ssl_context
+            url,
+            subprotocols=["graphql-ws"],
+            ssl=get_default_context(),
+            compression=None,
+            ping_interval=None,
+            max_size=WS_MAX_FRAME_SIZE,
+            open_timeout=WS_OPEN_TIMEOUT,
+            close_timeout=WS_CLOSE_TIMEOUT,
         ) as websocket:
-            self._websocket = websocket
+            self._set_websocket(websocket)
             self._reconnect_attempts = 0
 
             # Send connection init
-            await websocket.send(json.dumps({"type": "connection_init"}))
-
-            # Connection timeout (reset by heartbeats)
-            timeout = WS_HEARTBEAT_TIMEOUT
-            reconnect_timer = 0.0
-
-            while self._running:
-                try:
-                    raw_message = await asyncio.wait_for(
-                        websocket.recv(), timeout=timeout
-                    )
-                except asyncio.TimeoutError:
-                    _LOGGER.debug(
-                        "WebSocket %s: no heartbeat in %ds, reconnecting",
-                        self._label, timeout,
-                    )
-                    break
-                except websockets.exceptions.ConnectionClosedError as err:
-                    _LOGGER.debug(
-                        "WebSocket %s connection closed: %s", self._label, err
-                    )
-                    break
-
-                message = json.loads(raw_message)
-                msg_type = message.get("type")
+            await websocket.send(_INIT_FRAME)
+
+            # Connection timeout (reset by heartbeats), enforced by a single
+            # watchdog timer instead of a timeout per received frame
+            self._timeout = WS_HEARTBEAT_TIMEOUT
+            self._last_recv = loop.time()
+            self._watchdog = loop.call_at(
+                self._last_recv + self._timeout, self._check_watchdog, websocket
+            )
+            # Periodic reconnect deadline, measured on the loop clock
+            self._reconnect_at = self._last_recv + WS_RECONNECT_INTERVAL
+            self._close_task = None
 
-                if msg_type == "ka":
-                    # Heartbeat - no logging to avoid spam
-                    reconnect_timer += timeout
-                    if reconnect_timer >= WS_RECONNECT_INTERVAL:
+            try:
+                while self._running:
+                    try:
+                        raw_message = await websocket.recv()
+                    except websockets.exceptions.ConnectionClosed as err:
                         _LOGGER.debug(
-                            "WebSocket %s: periodic reconnect after %ds",
-                            self._label, WS_RECONNECT_INTERVAL,
+                            "WebSocket %s connection closed: %s", self._label, err
                         )
                         break
-                elif msg_type == "connection_ack":
-                    if message.get("payload"):
-                        timeout = (
-                            message["payload"]["connectionTimeoutMs"] / 1000
-                        )
-                    await self._async_create_subscription(websocket, ws_info["host"])
-                    _LOGGER.debug("WebSocket %s: subscription active", self._label)
-                elif msg_type == "data":
-                    await self._on_message(self._endpoint, message)
-                elif msg_type == "error":
-                    _LOGGER.warning(
-                        "WebSocket %s error message: %s", self._label, message
-                    )
-                else:
-                    _LOGGER.debug(
-                        "WebSocket %s unknown message type: %s",
-                        self._label, msg_type,
-                    )
+                    self._last_recv = loop.time()
+
+                    # Heartbeats dominate the traffic and are a fixed frame,
+                    # handle them inline without parsing
+                    if raw_message == _KA_FRAME:
+                        self._check_reconnect_due()
+                        continue
+
+                    message = orjson.loads(raw_message)
+                    handler = self._handlers.get(message.get("type"), self._on_unknown)
+                    # Only the ack handler is a coroutine
+                    if (pending := handler(message)) is not None:
+                        await pending
+            finally:
+                self._watchdog.cancel()
+
+        self._set_websocket(None)
+
+    async def _async_on_ack(self, message: dict) -> None:
+        """Apply the server's connection timeout and start the subscription."""
+        self._prev_delay = _BASE_RECONNECT_DELAY
+        if message.get("payload"):
+            self._timeout = message["payload"]["connectionTimeoutMs"] / 1000
+        await self._async_create_subscription(self._websocket, self._ws_info["host"])
+
+    def _on_start_ack(self, message: dict) -> None:
+        """Mark the connection live once the server accepted the subscription."""
+        self._set_subscribed(True)
+        _LOGGER.debug("WebSocket %s: subscription active", self._label)
+
+    def _on_heartbeat(self, message: dict) -> None:
+        """Handle a heartbeat not serialized as the usual frame."""
+        self._check_reconnect_due()
+
+    def _check_reconnect_due(self) -> None:
+        """Close the connection once the periodic reconnect is due."""
+        if self._last_recv < self._reconnect_at or self._close_task is not None:
+            return
+        _LOGGER.debug(
+            "WebSocket %s: periodic reconnect after %ds",
+            self._label, WS_RECONNECT_INTERVAL,
+        )
+        # Closing makes the pending recv() raise ConnectionClosed
+        self._close_task = asyncio.get_running_loop().create_task(
+            self._websocket.close()
+        )
 
-        self._websocket = None
+    def _on_error(self, message: dict) -> None:
+        """Log an error frame from the server."""
+        _LOGGER.warning("WebSocket %s error message: %s", self._label, message)
+
+    def _on_unknown(self, message: dict) -> None:
+        """Log a frame of an unexpected type."""
+        _LOGGER.debug(
+            "WebSocket %s unknown message type: %s", self._label, message.get("type")
+        )
+
+    def _check_watchdog(self, websocket) -> None:
+        """Close the connection if no frame arrived within the timeout."""
+        loop = asyncio.get_running_loop()
+        deadline = self._last_recv + self._timeout
+        if loop.time() < deadline:
+            # Frames arrived since the timer was armed, wait for the rest
+            self._watchdog = loop.call_at(deadline, self._check_watchdog, websocket)
+            return
+        _LOGGER.debug(
+            "WebSocket %s: no heartbeat in %ds, reconnecting",
+            self._label, self._timeout,
+        )
+        # Closing makes the pending recv() raise ConnectionClosed
+        self._close_task = loop.create_task(websocket.close())
+
+    def _set_websocket(self, websocket) -> None:
+        """Track the active connection; losing it ends the subscription."""
+        self._websocket = websocket
+        if websocket is None:
+            self._set_subscribed(False)
+
+    def _set_subscribed(self, subscribed: bool) -> None:
+        """Track the subscription and report connectivity changes."""
+        if subscribed != self._subscribed:
+            self._subscribed = subscribed
+            if self._on_connection_change is not None:
+                self._on_connection_change()
 
     async def _async_create_subscription(
         self, websocket, host: str
@@ -255,44 +471,10 @@ class HarviaWebSocket:
         """Create a GraphQL subscription on the WebSocket."""
         id_token = await self._api.async_get_id_token()
 
-        if self._endpoint == "data":
-            query_str = (
-                "subscription Subscription($receiver: String!) {\n"
-                "  onDataUpdates(receiver: $receiver) {\n"
-                "    item {\n"
-                "      deviceId\n"
-                "      timestamp\n"
-                "      sessionId\n"
-                "      type\n"
-                "      data\n"
-                "      __typename\n"
-                "    }\n"
-                "    __typename\n"
-                "  }\n"
-                "}\n"
-            )
-        else:  # device
-            query_str = (
-                "subscription Subscription($receiver: String!) {\n"
-                "  onStateUpdated(receiver: $receiver) {\n"
-                "    desired\n"
-                "    reported\n"
-                "    timestamp\n"
-                "    receiver\n"
-                "    __typename\n"
-                "  }\n"
-                "}\n"
-            )
-
-        subscription_data = {
-            "query": query_str,
-            "variables": {"receiver": self._receiver},
-        }
-
         payload = {
             "id": self._subscription_id,
             "payload": {
-                "data": json.dumps(subscription_data),
+                "data": self._subscription_data,
                 "extensions": {
                     "authorization": {
                         "Authorization": id_token,
@@ -304,4 +486,5 @@ class HarviaWebSocket:
             "type": "start",
         }
 
-        await websocket.send(json.dumps(payload))
+        # graphql-ws on AppSync only accepts text frames
+        await websocket.send(orjson.dumps(payload).decode())
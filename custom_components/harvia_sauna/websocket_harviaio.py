@@ -6,17 +6,34 @@ import asyncio
 import json
 import logging
 import random
-import ssl
 import uuid
 from typing import Any, Awaitable, Callable
 
 import websockets
 
+from homeassistant.util.ssl import get_default_context
+
 from .api_harviaio import HarviaIoApiClient, _normalize_state_payload, _normalize_telemetry_payload
-from .const import WS_HEARTBEAT_TIMEOUT, WS_MAX_RECONNECT_DELAY, WS_RECONNECT_INTERVAL
+from .const import (
+    WS_CLOSE_TIMEOUT,
+    WS_HEARTBEAT_TIMEOUT,
+    WS_MAX_FRAME_SIZE,
+    WS_MAX_RECONNECT_DELAY,
+    WS_OPEN_TIMEOUT,
+    WS_RECONNECT_INTERVAL,
+    WS_STOP_TIMEOUT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Jitter values drawn once; each connection starts at a random offset
+_RANDOM = random.SystemRandom()
+_JITTER = tuple(_RANDOM.random() for _ in range(64))
+
+# Constant control frames; subscription ids are uuid hex
+_INIT_FRAME = '{"type":"connection_init"}'
+_STOP_FRAME = '{"id":"%s","type":"stop"}'
+
 
 class HarviaIoWebSocketManager:
     """Manage Harvia GraphQL feed subscriptions."""
@@ -25,10 +42,12 @@ class HarviaIoWebSocketManager:
         self,
         api: HarviaIoApiClient,
         on_device_update: Callable[[dict], Awaitable[None]],
+        on_connection_change: Callable[[], None] | None = None,
     ) -> None:
         """Initialize websocket manager."""
         self._api = api
         self._on_device_update = on_device_update
+        self._on_connection_change = on_connection_change
         self._connections: list[HarviaIoWebSocket] = []
         self._tasks: list[asyncio.Task] = []
         self._running = False
@@ -55,12 +74,13 @@ class HarviaIoWebSocketManager:
                 endpoint=endpoint,
                 receiver=target_receiver,
                 on_message=self._handle_message,
+                on_connection_change=self._on_connection_change,
             )
             self._connections.append(ws)
             self._tasks.append(asyncio.create_task(ws.async_run()))
             _LOGGER.debug("Started WebSocket connection for feed: %s", endpoint)
 
-    async def async_stop(self) -> None:
+    async def async_stop(self, graceful: bool = True) -> None:
         """Stop all active websocket subscriptions."""
         if not self._running:
             _LOGGER.debug("WebSocket manager not running, nothing to stop")
@@ -69,7 +89,7 @@ class HarviaIoWebSocketManager:
         _LOGGER.debug("Stopping all WebSocket subscriptions (%d connections)", len(self._connections))
         self._running = False
         for ws in self._connections:
-            await ws.async_stop()
+            await ws.async_stop(graceful)
         for task in self._tasks:
             task.cancel()
             try:
@@ -114,9 +134,8 @@ class HarviaIoWebSocketManager:
             normalized = _normalize_state_payload(device_id, reported)
             _LOGGER.debug("Normalized device state for %s: %s", device_id, normalized)
 
-            # Pass as JSON string to match coordinator's expected format
-            reported_str = json.dumps(normalized)
-            update_payload = {"onStateUpdated": {"reported": reported_str}}
+            # Already decoded, the coordinator takes the dict as is
+            update_payload = {"onStateUpdated": {"reported": normalized}}
             _LOGGER.debug("Forwarding device update to coordinator: %s", update_payload)
             await self._on_device_update(update_payload)
             return
@@ -161,7 +180,7 @@ class HarviaIoWebSocketManager:
                     "item": {
                         "deviceId": device_id,
                         "timestamp": normalized.get("timestamp"),
-                        "data": json.dumps(normalized),
+                        "data": normalized,
                     }
                 }
             }
@@ -178,16 +197,20 @@ class HarviaIoWebSocket:
         endpoint: str,
         receiver: str,
         on_message: Callable[[str, dict[str, Any]], Awaitable[None]],
+        on_connection_change: Callable[[], None] | None = None,
     ) -> None:
         """Initialize connection state."""
         self._api = api
         self._endpoint = endpoint
         self._receiver = receiver
         self._on_message = on_message
+        self._on_connection_change = on_connection_change
         self._running = False
         self._websocket = None
+        self._subscribed = False
         self._reconnect_attempts = 0
-        self._subscription_id = str(uuid.uuid4())
+        self._jitter_idx = _RANDOM.randrange(64)
+        self._subscription_id = ""
         self._label = endpoint
 
     async def async_run(self) -> None:
@@ -210,13 +233,16 @@ class HarviaIoWebSocket:
                 else:
                     _LOGGER.warning("Harvia feed %s connection error: %s", self._label, err)
 
+            self._set_websocket(None)
             if not self._running:
                 break
-            delay = min(
-                2 ** self._reconnect_attempts + random.uniform(0, 1),
-                WS_MAX_RECONNECT_DELAY,
-            )
-            self._reconnect_attempts += 1
+            # Exponential base capped at the max delay; jitter is applied after
+            # the cap so capped feeds still spread out (50-100% of the delay)
+            base = min(1 << self._reconnect_attempts, WS_MAX_RECONNECT_DELAY)
+            delay = base * (0.5 + 0.5 * _JITTER[self._jitter_idx & 63])
+            self._jitter_idx += 1
+            # Clamped, the shift is meaningless past the cap anyway
+            self._reconnect_attempts = min(self._reconnect_attempts + 1, 30)
             _LOGGER.debug(
                 "Harvia feed %s reconnecting in %.1f seconds (attempt %d)",
                 self._label,
@@ -225,18 +251,26 @@ class HarviaIoWebSocket:
             )
             await asyncio.sleep(delay)
 
-    async def async_stop(self) -> None:
+    async def async_stop(self, graceful: bool = True) -> None:
         """Stop websocket connection."""
         self._running = False
         if self._websocket is not None:
+            # Send stop message before closing; during shutdown the server
+            # won't read it and the close frame suffices
+            if graceful:
+                try:
+                    await asyncio.wait_for(
+                        self._websocket.send(_STOP_FRAME % self._subscription_id),
+                        WS_STOP_TIMEOUT,
+                    )
+                except Exception:
+                    pass
             try:
-                await self._websocket.send(
-                    json.dumps({"id": self._subscription_id, "type": "stop"})
-                )
-                await self._websocket.close()
+                await self._websocket.close(code=1001)
             except Exception:
                 pass
             self._websocket = None
+            self._subscribed = False
 
     async def _async_connect_and_listen(self) -> None:
         """Connect and listen to feed updates."""
@@ -245,21 +279,29 @@ class HarviaIoWebSocket:
         id_token = await self._api.async_get_id_token()
         url = await self._api.async_get_websocket_url(self._endpoint, id_token)
 
-        self._subscription_id = str(uuid.uuid4())
-        loop = asyncio.get_running_loop()
-        ssl_context = await loop.run_in_executor(None, ssl.create_default_context)
-
+        self._subscription_id = uuid.uuid4().hex
+        # Home Assistant's shared client context, already loaded at startup.
+        # Frames are small and uncompressed; keepalive is the protocol's "ka"
+        # frame, so the library's own pings stay off
         async with websockets.connect(
-            url, subprotocols=["graphql-ws"], ssl=ssl_context
+            url,
+            subprotocols=["graphql-ws"],
+            ssl=get_default_context(),
+            compression=None,
+            ping_interval=None,
+            max_size=WS_MAX_FRAME_SIZE,
+            open_timeout=WS_OPEN_TIMEOUT,
+            close_timeout=WS_CLOSE_TIMEOUT,
         ) as websocket:
-            self._websocket = websocket
+            self._set_websocket(websocket)
             self._reconnect_attempts = 0
 
-            await websocket.send(json.dumps({"type": "connection_init"}))
+            await websocket.send(_INIT_FRAME)
 
+            loop = asyncio.get_running_loop()
             timeout = WS_HEARTBEAT_TIMEOUT
-            reconnect_timer = 0.0
-            subscription_active = False
+            # Periodic reconnect deadline, measured on the loop clock
+            reconnect_at = loop.time() + WS_RECONNECT_INTERVAL
 
             while self._running:
                 try:
@@ -273,12 +315,14 @@ class HarviaIoWebSocket:
 
                 message = json.loads(raw_message)
                 msg_type = message.get("type")
-                _LOGGER.debug("WebSocket %s received message type=%s payload=%s", self._label, msg_type, str(message)[:200])
+                # Truncating the payload costs a full str(); only do it when logged
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("WebSocket %s received message type=%s payload=%s", self._label, msg_type, str(message)[:200])
 
                 if msg_type == "ka":
-                    reconnect_timer += timeout
-                    _LOGGER.debug("WebSocket %s keepalive, reconnect_timer=%.0f/%.0f", self._label, reconnect_timer, WS_RECONNECT_INTERVAL)
-                    if reconnect_timer >= WS_RECONNECT_INTERVAL:
+                    remaining = reconnect_at - loop.time()
+                    _LOGGER.debug("WebSocket %s keepalive, reconnect in %.0fs", self._label, remaining)
+                    if remaining <= 0:
                         _LOGGER.debug("WebSocket %s reconnect interval exceeded, reconnecting", self._label)
                         break
                 elif msg_type == "connection_ack":
@@ -289,12 +333,13 @@ class HarviaIoWebSocket:
                     await self._async_start_subscription(websocket, ws_info["host"], id_token)
                 elif msg_type == "start_ack":
                     # Subscription successfully registered, now expecting data
-                    subscription_active = True
+                    self._set_subscribed(True)
                     _LOGGER.info("WebSocket %s subscription registered and active", self._label)
                 elif msg_type == "data":
-                    if subscription_active:
+                    if self._subscribed:
                         try:
-                            _LOGGER.debug("WebSocket %s processing data message: %s", self._label, str(message)[:300])
+                            if _LOGGER.isEnabledFor(logging.DEBUG):
+                                _LOGGER.debug("WebSocket %s processing data message: %s", self._label, str(message)[:300])
                             await self._on_message(self._endpoint, message)
                         except Exception as err:
                             _LOGGER.error("Error processing message from feed %s: %s", self._label, err)
@@ -310,7 +355,20 @@ class HarviaIoWebSocket:
                 else:
                     _LOGGER.debug("WebSocket %s received unknown message type: %s full_message=%s", self._label, msg_type, message)
 
-        self._websocket = None
+        self._set_websocket(None)
+
+    def _set_websocket(self, websocket) -> None:
+        """Track the active connection; losing it ends the subscription."""
+        self._websocket = websocket
+        if websocket is None:
+            self._set_subscribed(False)
+
+    def _set_subscribed(self, subscribed: bool) -> None:
+        """Track the subscription and report connectivity changes."""
+        if subscribed != self._subscribed:
+            self._subscribed = subscribed
+            if self._on_connection_change is not None:
+                self._on_connection_change()
 
     async def _async_start_subscription(self, websocket, host: str, id_token: str) -> None:
         """Send GraphQL subscription start frame."""